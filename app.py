@@ -1,35 +1,128 @@
-from flask import Flask, render_template, request, session, redirect, url_for, jsonify
+import eventlet
+# 소켓/스레드/시간 함수를 그린 버전으로 교체 - 다른 import보다 먼저
+# (Redis 메시지 큐/상태 저장소의 소켓 I/O가 허브를 막지 않도록)
+eventlet.monkey_patch()
+
+from flask import Flask, render_template, request, session, redirect, url_for, jsonify, Response
 from flask_socketio import SocketIO, emit, join_room, leave_room
 import uuid
-import logging
 import os
-import eventlet
+import functools
 
 # 모듈 import
 from auth import AuthManager
 from room_manager import RoomManager
 from user_manager import UserManager
 from translator import TranslatorManager
+from system_messages import SystemMessageCatalog
+from state_store import create_state_store
+from message_history import MessageHistory
+from rate_limiter import ConnectionRateLimiter
+from outbound_queue import OutboundQueues
+from circuit_breaker import STATE_CODES
+import metrics
+from chat_logging import setup_logging, get_logger
 
-# 로깅 설정
-logging.basicConfig(level=logging.DEBUG)
+# 로깅 설정 - 큐 기반 비동기 출력 (LOG_LEVEL, LOG_LEVELS, LOG_FORMAT)
+setup_logging()
+logger = get_logger(__name__)
 
 app = Flask(__name__)
 app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY', 'default-secret-key-for-development')
 
 # 모듈 초기화
 auth_manager = AuthManager(app)
-room_manager = RoomManager()
-user_manager = UserManager()
+state_store = create_state_store()  # STATE_STORE_URL=redis://... 이면 여러 프로세스가 상태 공유
+room_manager = RoomManager(state_store)
+user_manager = UserManager(state_store)
 translator_manager = TranslatorManager()
+system_messages = SystemMessageCatalog()
+
+# 방별 최근 메시지 기록 - 입장/재접속 시 번역 호출 없이 다시 보여준다
+message_history = MessageHistory(
+    max_entries=int(os.environ.get('MESSAGE_HISTORY_SIZE', 50)),
+    max_bytes_per_room=int(os.environ.get('MESSAGE_HISTORY_MAX_BYTES', 64 * 1024)),
+    max_rooms=int(os.environ.get('MESSAGE_HISTORY_MAX_ROOMS', 1000))
+)
+
+def on_room_deleted(room_id):
+    """방이 실제로 삭제될 때 방별 부가 상태 정리"""
+    message_history.remove_room(room_id)
+    user_manager.clear_room_presence(room_id)
+
+room_manager.on_room_deleted = on_room_deleted
+HISTORY_REPLAY_LIMIT = int(os.environ.get('MESSAGE_HISTORY_REPLAY', 50))
 
+# 조회 시점에 계산하는 상태 지표
+metrics.registry.gauge('chat_rooms', 'Active chat rooms', func=room_manager.count_rooms)
+metrics.registry.gauge('chat_users', 'Connected users', func=user_manager.count_users)
+metrics.registry.gauge('room_cleanup_pending', 'Empty rooms waiting for cleanup',
+                       func=room_manager.count_pending_cleanups)
+metrics.registry.gauge('translation_pool_queue_depth', 'Translation jobs waiting for a worker',
+                       func=lambda: translator_manager.pool.queued)
+metrics.registry.gauge('translation_cache_hit_ratio', 'Translation cache hit ratio',
+                       func=lambda: translator_manager.cache.get_stats()['hit_rate'])
+metrics.registry.gauge('translation_circuit_breaker_state', 'Translation backend circuit breaker state (0=closed, 1=half_open, 2=open)',
+                       func=lambda: STATE_CODES[translator_manager.circuit_breaker.state])
+metrics.registry.counter('translation_circuit_breaker_rejected_total', 'Translation backend calls rejected by the circuit breaker',
+                         func=lambda: translator_manager.circuit_breaker.rejected)
+metrics.registry.counter('translation_circuit_breaker_opened_total', 'Times the translation backend circuit breaker opened',
+                         func=lambda: translator_manager.circuit_breaker.times_opened)
+metrics.registry.counter('translation_rate_limit_throttled_total', 'Translation backend calls rejected by the token bucket',
+                         func=lambda: translator_manager.rate_limiter.throttled)
+
+# 패킷 직렬화 - default(JSON) 또는 msgpack(바이너리, 클라이언트도 msgpack 번들 사용)
+SOCKETIO_SERIALIZER = os.environ.get('SOCKETIO_SERIALIZER', 'default')
+if SOCKETIO_SERIALIZER not in ('default', 'msgpack'):
+    raise ValueError(f"알 수 없는 SOCKETIO_SERIALIZER: {SOCKETIO_SERIALIZER}")
+
+# 여러 프로세스가 같은 방에 브로드캐스트할 수 있도록 메시지 큐 사용 (예: redis://...)
 socketio = SocketIO(app, 
                   cors_allowed_origins="*", 
                   logger=False, 
                   engineio_logger=False,
                   async_mode='eventlet',
+                  message_queue=os.environ.get('SOCKETIO_MESSAGE_QUEUE'),
+                  serializer=SOCKETIO_SERIALIZER,
                   transports=['websocket', 'polling'])
 
+@app.context_processor
+def inject_socketio_client():
+    """서버 직렬화 방식에 맞는 Socket.IO 클라이언트 번들 - 양쪽 파서가 같아야 연결된다"""
+    bundle = 'socket.io.msgpack.min.js' if SOCKETIO_SERIALIZER == 'msgpack' else 'socket.io.min.js'
+    return {'socketio_client_url': f"https://cdn.socket.io/4.7.2/{bundle}"}
+
+# 연결별 이벤트 속도 제한 - (초당 허용 수, 순간 허용량)
+connection_limiter = ConnectionRateLimiter({
+    'send_message': (float(os.environ.get('SEND_MESSAGE_RATE', 2)), int(os.environ.get('SEND_MESSAGE_BURST', 10))),
+    'create_room': (float(os.environ.get('CREATE_ROOM_RATE', 0.2)), int(os.environ.get('CREATE_ROOM_BURST', 3))),
+    'join_room_request': (float(os.environ.get('JOIN_ROOM_RATE', 1)), int(os.environ.get('JOIN_ROOM_BURST', 5)))
+})
+
+# 느린 수신자 송신 큐 - 정책: drop_oldest | coalesce | disconnect
+outbound = OutboundQueues(
+    socketio,
+    max_size=int(os.environ.get('OUTBOUND_QUEUE_SIZE', 100)),
+    policy=os.environ.get('OUTBOUND_QUEUE_POLICY', 'drop_oldest'),
+    slow_threshold=int(os.environ.get('OUTBOUND_SLOW_THRESHOLD', 50))
+)
+outbound.start()
+metrics.registry.gauge('outbound_slow_consumers', 'Connections currently served from an outbound queue',
+                       func=outbound.count_slow)
+
+def rate_limited(event_name):
+    """연결별 속도 제한을 넘은 이벤트는 처리하지 않고 rate_limited로 알린다"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not connection_limiter.allow(request.sid, event_name):
+                metrics.socket_events_throttled.inc(event=event_name)
+                emit('rate_limited', {'event': event_name})
+                return
+            return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
 @app.route('/')
 def index():
     if not auth_manager.is_authenticated():
@@ -70,8 +163,67 @@ def logout():
 
 @app.route('/api/rooms')
 def get_rooms():
-    """활성 채팅방 목록 반환"""
-    return jsonify(room_manager.get_rooms_list())
+    """
+    활성 채팅방 목록 반환 - ETag/If-None-Match, 페이지, 정렬 지원
+    ?sort=created|title|user_count&order=asc|desc&page=1&per_page=50
+    """
+    page = request.args.get('page', 1, type=int)
+    per_page = request.args.get('per_page', type=int)
+    result = room_manager.directory.get_page(
+        sort=request.args.get('sort', 'created'),
+        reverse=request.args.get('order', 'asc') == 'desc',
+        page=page,
+        per_page=min(per_page, 200) if per_page else None
+    )
+    
+    # 본문은 기존처럼 방 배열, 버전/전체 개수는 헤더로 전달
+    response = jsonify(result['rooms'])
+    response.headers['X-Rooms-Version'] = str(result['version'])
+    response.headers['X-Total-Count'] = str(result['total'])
+    response.headers['Cache-Control'] = 'no-cache'
+    response.set_etag(f"rooms-{result['version']}")
+    return response.make_conditional(request)
+
+# 로비 화면들이 rooms_delta를 받는 Socket.IO 룸
+LOBBY_ROOM = 'lobby'
+
+def broadcast_rooms_delta(delta):
+    """방 목록 변경 사항을 로비에 푸시"""
+    # 느린 수신자에게는 최신 델타만 - 버전이 건너뛰면 클라이언트가 목록을 다시 받는다
+    outbound.emit('rooms_delta', delta, room=LOBBY_ROOM, coalesce_key='rooms')
+
+room_manager.directory.on_delta = broadcast_rooms_delta
+
+@app.route('/metrics')
+def metrics_endpoint():
+    """Prometheus 텍스트 형식 지표"""
+    return Response(metrics.registry.render(), mimetype='text/plain; version=0.0.4')
+
+def language_room(room_id, language):
+    """방 안의 언어별 Socket.IO 하위 룸 이름 (예: room_id:ko)"""
+    return f"{room_id}:{language}"
+
+def broadcast_presence(room_id, added=(), removed=(), updated=(), skip_sid=None):
+    """방 참가자 변경분만 버전과 함께 전송 - 클라이언트는 버전이 건너뛰면 presence_sync 요청"""
+    version = user_manager.bump_presence_version(room_id)
+    outbound.emit('presence_delta', {
+        'room_id': room_id,
+        'version': version,
+        'added': list(added),
+        'removed': list(removed),
+        'updated': list(updated)
+    }, room=room_id, skip_sid=skip_sid, coalesce_key=('presence', room_id))
+
+def broadcast_member_left(room_id, user, session_id):
+    """
+    접속 하나가 방을 나간 뒤 호출 - 계정의 마지막 접속일 때만 removed 전송
+    같은 계정의 다른 접속이 남아 있으면 그 접속 정보가 다를 때만 updated
+    """
+    remaining = user_manager.find_account_session(room_id, user.google_id, exclude_sid=session_id)
+    if remaining is None:
+        broadcast_presence(room_id, removed=[user.member_id])
+    elif remaining.to_member() != user.to_member():
+        broadcast_presence(room_id, updated=[remaining.to_member()])
 
 # Socket 이벤트 핸들러들
 @socketio.on('connect')
@@ -80,33 +232,43 @@ def on_connect():
         return False
     
     user_info = user_manager.add_user(request.sid, session['user'])
-    print(f'사용자 연결: {session["user"]["name"]} ({request.sid})')
-    emit('connected', {'status': 'success', 'user': user_info})
+    logger.info("사용자 연결", session_id=request.sid, nickname=session['user']['name'])
+    emit('connected', {'status': 'success', 'user': user_info.to_dict()})
 
 @socketio.on('disconnect')
+@metrics.timed_handler('disconnect')
 def on_disconnect():
+    connection_limiter.remove(request.sid)
     user = user_manager.remove_user(request.sid)
-    if user and user['current_room']:
+    if user and user.current_room:
         # 현재 방에서 나가기 처리
-        room_manager.leave_room(user['current_room'], request.sid)
+        room_id = user.current_room
+        room_manager.leave_room(room_id, request.sid)
+        if user.language:
+            leave_room(language_room(room_id, user.language))
+        broadcast_member_left(room_id, user, request.sid)
         
         # 퇴장 알림 - 유령 방지를 위한 안전한 닉네임 확인
-        if user.get('nickname'):
-            room_users = room_manager.get_room_users(user['current_room'])
-            for sid in room_users:
-                if sid != request.sid and user_manager.is_user_exists(sid):
-                    target_user = user_manager.get_user(sid)
-                    if target_user and target_user.get('language'):
-                        target_lang = target_user['language']
-                        leave_msg = translator_manager.translate_text(
-                            f"{user['nickname']} left the chat room.", 
-                            'en', 
-                            target_lang
-                        )
-                        emit('user_left', {
-                            'message': leave_msg,
-                            'nickname': user['nickname']
-                        }, room=sid)
+        if user.nickname:
+            # 언어별 템플릿으로 만들어 언어 하위 룸에 전송 - 번역 호출 없음
+            for target_lang in user_manager.get_language_groups(room_id):
+                leave_msg = system_messages.render('user_left', target_lang, nickname=user.nickname)
+                outbound.emit('user_left', {
+                    'message': leave_msg,
+                    'nickname': user.nickname
+                }, room=language_room(room_id, target_lang))
+
+@socketio.on('join_lobby')
+def on_join_lobby():
+    """로비 채널 구독 - 이후 rooms_delta 수신"""
+    join_room(LOBBY_ROOM)
+    version, _ = room_manager.directory.get_rooms()
+    emit('lobby_joined', {'version': version})
+
+@socketio.on('leave_lobby')
+def on_leave_lobby():
+    """로비 채널 구독 해제"""
+    leave_room(LOBBY_ROOM)
 
 @socketio.on('set_language')
 def on_set_language(data):
@@ -116,7 +278,17 @@ def on_set_language(data):
         return
     
     language_code = translator_manager.get_language_code(data['language'])
+    user = user_manager.get_user(request.sid)
+    previous_language = user.language
     if user_manager.set_user_language(request.sid, language_code):
+        # 방에 있는 상태에서 언어를 바꾸면 언어 하위 룸도 옮긴다
+        if user.current_room and previous_language != language_code:
+            if previous_language:
+                leave_room(language_room(user.current_room, previous_language))
+            join_room(language_room(user.current_room, language_code))
+            broadcast_presence(user.current_room,
+                               updated=[user_manager.get_user(request.sid).to_member()])
+        
         # 세션에도 언어 정보 저장
         if 'user' in session:
             session['user']['language'] = language_code
@@ -127,6 +299,7 @@ def on_set_language(data):
         emit('language_error', {'message': 'Failed to set language'})
 
 @socketio.on('create_room')
+@rate_limited('create_room')
 def on_create_room(data):
     """새 채팅방 생성"""
     user = user_manager.get_user(request.sid)
@@ -138,7 +311,7 @@ def on_create_room(data):
         data['title'],
         data.get('password', ''),
         data.get('max_users', 50),
-        user['nickname']
+        user.nickname
     )
     
     emit('room_created', {
@@ -148,6 +321,8 @@ def on_create_room(data):
     })
 
 @socketio.on('join_room_request')
+@metrics.timed_handler('join_room_request')
+@rate_limited('join_room_request')
 def on_join_room_request(data):
     """채팅방 입장 요청 - 언어 확인 추가"""
     user = user_manager.get_user(request.sid)
@@ -156,7 +331,7 @@ def on_join_room_request(data):
         return
     
     # 언어가 설정되지 않은 경우 언어 선택 요구
-    if not user.get('language'):
+    if not user.language:
         emit('language_required', {'room_id': data['room_id']})
         return
     
@@ -164,9 +339,13 @@ def on_join_room_request(data):
     password = data.get('password', '')
     
     # 이전 방에서 나가기
-    if user['current_room']:
-        room_manager.leave_room(user['current_room'], request.sid)
+    if user.current_room:
+        previous_room = user.current_room
+        room_manager.leave_room(previous_room, request.sid)
+        leave_room(previous_room)
+        leave_room(language_room(previous_room, user.language))
         user_manager.set_user_room(request.sid, None)
+        broadcast_member_left(previous_room, user, request.sid)
     
     # 새 방 입장 시도
     success, message = room_manager.join_room(room_id, request.sid, password)
@@ -177,106 +356,161 @@ def on_join_room_request(data):
     
     # 입장 성공 처리
     join_room(room_id)
+    join_room(language_room(room_id, user.language))
     user_manager.set_user_room(request.sid, room_id)
     
-    # 입장 알림 - 중복 방지를 위한 단일 emit
-    room_users = room_manager.get_room_users(room_id)
-    join_msg_sent = False  # 중복 방지 플래그
+    # 입장 알림 - 언어별 템플릿으로 만들어 언어 하위 룸에 전송 (번역 호출 없음)
+    language_groups = user_manager.get_language_groups(room_id)
     
-    for sid in room_users:
-        if sid != request.sid and user_manager.is_user_exists(sid):
-            target_user = user_manager.get_user(sid)
-            if target_user and target_user.get('language') and not join_msg_sent:
-                target_lang = target_user['language']
-                join_msg = translator_manager.translate_text(
-                    f"{user['nickname']} joined the chat room.", 
-                    'en', 
-                    target_lang
-                )
-                emit('user_joined', {
-                    'message': join_msg,
-                    'nickname': user['nickname'],
-                    'user': {
-                        'nickname': user['nickname'],
-                        'language': user['language'],
-                        'picture': user['google_info'].get('picture', '')
-                    }
-                }, room=room_id)
-                join_msg_sent = True  # 한 번만 전송되도록 설정
-                break
+    for target_lang, session_ids in language_groups.items():
+        if session_ids == {request.sid}:
+            continue  # 같은 언어 사용자가 본인뿐이면 보낼 대상 없음
+        join_msg = system_messages.render('user_joined', target_lang, nickname=user.nickname)
+        outbound.emit('user_joined', {
+            'message': join_msg,
+            'nickname': user.nickname
+        }, room=language_room(room_id, target_lang), skip_sid=request.sid)
     
-    # 현재 방 사용자 목록 전송 - 정리된 목록
-    current_room_users = user_manager.get_room_user_list(room_users)
+    # 기존 참가자에게는 추가된 한 명만, 입장한 사용자에게는 전체 스냅샷
+    # 같은 계정이 이미 방에 있으면 참가자 목록은 그대로
+    if user_manager.find_account_session(room_id, user.google_id, exclude_sid=request.sid) is None:
+        broadcast_presence(room_id, added=[user.to_member()], skip_sid=request.sid)
+    presence = user_manager.get_presence_snapshot(room_id)
+    
+    # 최근 메시지를 입장한 사용자 언어로 - 이미 만들어진 번역본만 사용
+    history = message_history.get_recent(room_id, user.language, limit=HISTORY_REPLAY_LIMIT)
     
     emit('room_joined', {
         'success': True,
         'room_info': room_manager.get_room_info(room_id),
-        'users': current_room_users
+        'presence': presence,
+        'history': history
     })
 
 @socketio.on('leave_room')
 def on_leave_room():
     """채팅방 나가기"""
     user = user_manager.get_user(request.sid)
-    if not user or not user['current_room']:
+    if not user or not user.current_room:
         return
     
-    room_id = user['current_room']
+    room_id = user.current_room
     room_manager.leave_room(room_id, request.sid)
     leave_room(room_id)
+    if user.language:
+        leave_room(language_room(room_id, user.language))
     user_manager.set_user_room(request.sid, None)
+    broadcast_member_left(room_id, user, request.sid)
     
     emit('room_left', {'success': True})
 
+@socketio.on('presence_sync')
+def on_presence_sync():
+    """버전 누락을 감지한 클라이언트에게 참가자 전체 스냅샷 재전송"""
+    user = user_manager.get_user(request.sid)
+    if not user or not user.current_room:
+        return
+    emit('presence_snapshot', user_manager.get_presence_snapshot(user.current_room))
+
 @socketio.on('send_message')
+@metrics.timed_handler('send_message')
+@rate_limited('send_message')
 def on_send_message(data):
     """메시지 전송 - 개선된 번역 로직"""
     sender = user_manager.get_user(request.sid)
-    if not sender or not sender['current_room'] or not sender.get('language'):
+    if not sender or not sender.current_room or not sender.language:
         return
     
-    room_id = sender['current_room']
+    room_id = sender.current_room
     original_message = data['message']
-    sender_nickname = sender['nickname']
-    sender_lang = sender['language']
+    sender_nickname = sender.nickname
+    sender_lang = sender.language
     
-    print(f"메시지 전송: {sender_nickname} ({sender_lang}) -> {original_message}")
+    logger.debug("메시지 전송", room_id=room_id, session_id=request.sid, language=sender_lang,
+                 length=len(original_message), sample_rate=0.1)
     
-    # 같은 방의 모든 사용자에게 개별 번역하여 전송
-    room_users = room_manager.get_room_users(room_id)
+    message_id = message_history.add_message(room_id, sender_nickname, original_message, sender_lang)
     
-    for sid in room_users:
-        if user_manager.is_user_exists(sid):
-            target_user = user_manager.get_user(sid)
-            if target_user and target_user.get('language'):
-                target_lang = target_user['language']
-                
-                if sid == request.sid:
-                    # 발신자에게는 원본 메시지
-                    translated_message = original_message
-                else:
-                    # 수신자에게는 번역된 메시지 - 소스 언어 명시
-                    translated_message = translator_manager.translate_text(
-                        original_message, 
-                        sender_lang, 
-                        target_lang
-                    )
-                
-                emit('receive_message', {
-                    'nickname': sender_nickname,
-                    'message': translated_message,
-                    'original_language': translator_manager.get_language_name(sender_lang),
-                    'is_own_message': (sid == request.sid)
-                }, room=sid)
+    # 발신자에게는 원본 메시지
+    # 언어는 표시 이름 대신 코드로 보내고, is_own_message는 본인 에코에만 넣는다 (페이로드 축소)
+    emit('receive_message', {
+        'message_id': message_id,
+        'nickname': sender_nickname,
+        'message': original_message,
+        'original_language': sender_lang,
+        'is_own_message': True
+    })
+    
+    # 수신자는 언어별로 묶어서 언어당 한 번만 번역하고 언어 하위 룸으로 전송
+    # 색인된 언어 그룹을 그대로 사용 - 발신자만 있는 언어 그룹은 제외
+    language_groups = user_manager.get_language_groups(room_id)
+    if language_groups.get(sender_lang) == {request.sid}:
+        del language_groups[sender_lang]
+    recipients = sum(len(sids) for sids in language_groups.values())
+    if sender_lang in language_groups:
+        recipients -= 1  # 발신자 본인
+    metrics.fanout_recipients.observe(recipients)
+    metrics.fanout_languages.observe(len(language_groups))
+    
+    # 같은 언어 사용자에게는 번역을 기다리지 않고 먼저 전송
+    if sender_lang in language_groups:
+        outbound.emit('receive_message', {
+            'message_id': message_id,
+            'nickname': sender_nickname,
+            'message': original_message,
+            'original_language': sender_lang
+        }, room=language_room(room_id, sender_lang), skip_sid=request.sid)
+    
+    # 나머지 언어는 기다리지 않고 바로 전송 - 캐시에 있는 번역은 바로 번역본으로,
+    # 없으면 원본을 먼저 보내고 번역이 끝나는 대로 message_translated로 교체
+    target_langs = [lang for lang in language_groups if lang != sender_lang]
+    translations, pending = translator_manager.submit_many(
+        original_message, sender_lang, target_langs,
+        is_cancelled=lambda target_lang: not has_translation_recipients(room_id, target_lang)
+    )
+    
+    for target_lang in target_langs:
+        payload = {
+            'message_id': message_id,
+            'nickname': sender_nickname,
+            'message': translations.get(target_lang, original_message),
+            'original_language': sender_lang
+        }
+        if target_lang in pending:
+            payload['pending'] = True
+        elif translations[target_lang] != original_message:
+            message_history.add_translation(room_id, message_id, target_lang, translations[target_lang])
+        outbound.emit('receive_message', payload,
+                      room=language_room(room_id, target_lang), skip_sid=request.sid)
+    
+    if pending:
+        socketio.start_background_task(deliver_translations, room_id, message_id,
+                                       original_message, sender_lang, pending)
+
+def has_translation_recipients(room_id, language):
+    """번역을 받을 사람이 아직 방에 있는지 - 없으면 대기 중인 번역 작업을 버린다"""
+    room_users = room_manager.get_room_users(room_id)
+    return any(sid in room_users for sid in user_manager.get_language_users(room_id, language))
+
+def deliver_translations(room_id, message_id, original_message, sender_lang, pending):
+    """번역이 끝나는 언어부터 message_translated 전송 - 실패해도 보내서 클라이언트 대기 표시를 지운다"""
+    for target_lang, translated in translator_manager.iter_completed(original_message, sender_lang, pending):
+        # 번역에 성공한 언어만 기록에 남긴다
+        if translated != original_message:
+            message_history.add_translation(room_id, message_id, target_lang, translated)
+        outbound.emit('message_translated', {
+            'message_id': message_id,
+            'language': target_lang,
+            'message': translated
+        }, room=language_room(room_id, target_lang))
 
 # 에러 핸들러
 @app.errorhandler(500)
 def internal_error(error):
-    print(f"내부 서버 오류: {error}")
+    logger.error("내부 서버 오류", error=str(error))
     return redirect('/login?error=server_error')
 
 if __name__ == '__main__':
     port = int(os.environ.get('PORT', 5000))
-    print(f"서버 시작: 포트 {port}")
-    print(f"Google OAuth 설정됨: {auth_manager.google is not None}")
+    logger.info("서버 시작", port=port, google_oauth=auth_manager.google is not None)
     socketio.run(app, debug=False, host='0.0.0.0', port=port)
\ No newline at end of file
@@ -0,0 +1,318 @@
+"""
+채팅 부하 벤치마크 - Socket.IO 핸들러를 test_client로 직접 구동
+
+N개 방 x M명 사용자(ko/en/ja 비율 지정)가 정해진 속도로 메시지를 보내고
+입장/퇴장을 반복하는 상황을 흉내 낸다. 번역은 오프라인 local 백엔드를 사용한다.
+
+    python benchmarks/chat_load.py --rooms 20 --users 8 --rate 2 --duration 10
+
+결과(초당 메시지, 전달 지연 백분위, 후속 번역 지연, 메시지당 번역 호출, 최대 메모리)는
+benchmarks/results/ 아래 JSON으로 저장해서 변경 전후를 비교한다.
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import resource
+import subprocess
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULTS_DIR = os.path.join(ROOT, 'benchmarks', 'results')
+
+LANGUAGE_NAMES = {'ko': 'korean', 'en': 'english', 'ja': 'japanese'}
+
+SAMPLE_MESSAGES = {
+    'ko': ['안녕하세요 여러분', '오늘 날씨가 정말 좋네요', '점심 뭐 먹을까요?',
+           '회의는 세 시에 시작합니다', '주말에 영화 보러 갈 사람?'],
+    'en': ['hello everyone', 'the weather is really nice today', 'what should we eat for lunch?',
+           'the meeting starts at three', 'anyone up for a movie this weekend?'],
+    'ja': ['皆さんこんにちは', '今日はとてもいい天気ですね', 'お昼は何を食べましょうか?',
+           '会議は三時に始まります', '週末に映画を見に行く人はいますか?']
+}
+
+def parse_language_mix(spec):
+    """'ko=2,en=1,ja=1' -> [(lang, weight)]"""
+    mix = []
+    for item in spec.split(','):
+        lang, _, weight = item.partition('=')
+        lang = lang.strip()
+        if lang not in LANGUAGE_NAMES:
+            raise SystemExit(f"지원하지 않는 언어: {lang}")
+        mix.append((lang, float(weight or 1)))
+    return mix
+
+def percentile(sorted_values, pct):
+    """정렬된 값에서 백분위 (최근접 순위)"""
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, max(0, int(round(pct / 100 * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+def git_revision():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT,
+                                       stderr=subprocess.DEVNULL).decode().strip()
+    except Exception:
+        return None
+
+
+class DeliveryRecorder:
+    """
+    test_client 수신 큐 대신 사용 - 받은 시각만 기록하고 내용은 버린다
+    (get_received()는 큐를 일반 list로 바꿔 버리므로 호출하지 않는다)
+    """
+
+    def __init__(self):
+        self.sent_at = {}  # message_id: 발신 시각
+        self.latencies = []  # 첫 전달(원본 또는 캐시된 번역)까지
+        self.translated_latencies = []  # message_translated(후속 번역)까지
+        self.delivered = 0
+        self.events = {}
+
+    def queue_for(self, client):
+        recorder = self
+
+        class RecordingQueue(list):
+            def append(self, item):
+                name = item['name']
+                recorder.events[name] = recorder.events.get(name, 0) + 1
+                if name == 'receive_message':
+                    recorder.record(client, item['args'][0])
+                elif name == 'message_translated':
+                    recorder.record_translated(item['args'][0])
+                elif name == 'room_created':
+                    client.bench_room_id = item['args'][0]['room_id']
+
+        return RecordingQueue()
+
+    def record(self, client, payload):
+        now = time.perf_counter()
+        message_id = payload.get('message_id')
+        if payload.get('is_own_message'):
+            # 발신자 에코가 가장 먼저 오므로 여기서 message_id와 발신 시각을 연결
+            self.sent_at[message_id] = client.bench_sent_at
+            return
+        sent_at = self.sent_at.get(message_id)
+        if sent_at is not None:
+            self.latencies.append(now - sent_at)
+            self.delivered += 1
+
+    def record_translated(self, payload):
+        sent_at = self.sent_at.get(payload.get('message_id'))
+        if sent_at is not None:
+            self.translated_latencies.append(time.perf_counter() - sent_at)
+
+
+class ChatLoadBenchmark:
+    def __init__(self, options):
+        self.options = options
+        self.random = random.Random(options.seed)
+        self.language_mix = parse_language_mix(options.languages)
+        self.recorder = DeliveryRecorder()
+        self.rooms = []  # [(room_id, [client])]
+        self.messages_sent = 0
+        self.joins = 0
+        self.leaves = 0
+
+    def setup_app(self):
+        """환경 변수로 local 백엔드를 고른 뒤 앱 import"""
+        os.environ['TRANSLATION_BACKEND'] = 'local'
+        os.environ['LOCAL_TRANSLATION_LATENCY_MS'] = str(self.options.translation_latency_ms)
+        os.environ['LOCAL_TRANSLATION_SEED'] = str(self.options.seed)
+        os.environ.setdefault('LOG_LEVEL', 'WARNING')
+        os.environ.pop('SOCKETIO_MESSAGE_QUEUE', None)  # test_client는 메시지 큐와 함께 쓸 수 없음
+        sys.path.insert(0, ROOT)
+
+        import app as chat_app
+        self.chat_app = chat_app
+
+    def pick_language(self):
+        total = sum(weight for _, weight in self.language_mix)
+        point = self.random.uniform(0, total)
+        for lang, weight in self.language_mix:
+            point -= weight
+            if point <= 0:
+                return lang
+        return self.language_mix[-1][0]
+
+    def connect_client(self, name, language):
+        chat_app = self.chat_app
+        flask_client = chat_app.app.test_client()
+        with flask_client.session_transaction() as flask_session:
+            flask_session['user'] = {'id': name, 'email': f"{name}@bench.local", 'name': name, 'picture': ''}
+
+        client = chat_app.socketio.test_client(chat_app.app, flask_test_client=flask_client)
+        client.queue = self.recorder.queue_for(client)
+        client.bench_sent_at = None
+        client.bench_room_id = None
+        client.bench_language = language
+        client.emit('set_language', {'language': LANGUAGE_NAMES[language]})
+        return client
+
+    def build_rooms(self):
+        options = self.options
+        for room_index in range(options.rooms):
+            members = [self.connect_client(f"r{room_index}u{user_index}", self.pick_language())
+                       for user_index in range(options.users)]
+            owner = members[0]
+            owner.emit('create_room', {'title': f"bench-{room_index}", 'password': '',
+                                       'max_users': options.users + 1})
+            room_id = owner.bench_room_id
+            for client in members:
+                client.emit('join_room_request', {'room_id': room_id})
+                self.joins += 1
+            self.rooms.append((room_id, members))
+
+    def next_message(self, language):
+        text = self.random.choice(SAMPLE_MESSAGES[language])
+        # 일부는 고유 문장으로 만들어 캐시에 걸리지 않게 한다
+        if self.random.random() < self.options.unique_ratio:
+            text = f"{text} #{self.messages_sent}"
+        return text
+
+    def run_room(self, room_id, members, deadline):
+        """방 하나의 발신/입퇴장 루프 - 방마다 그린스레드 하나"""
+        import eventlet
+
+        interval = 1.0 / self.options.rate
+        next_send = time.perf_counter()
+        while True:
+            now = time.perf_counter()
+            if now >= deadline:
+                return
+            if now < next_send:
+                eventlet.sleep(next_send - now)
+                continue
+            next_send += interval
+
+            if self.random.random() < self.options.churn:
+                # 퇴장 후 바로 재입장 - 입장 알림, 기록 재생, 방 목록 갱신 경로를 함께 구동
+                client = self.random.choice(members)
+                client.emit('leave_room')
+                client.emit('join_room_request', {'room_id': room_id})
+                self.leaves += 1
+                self.joins += 1
+
+            sender = self.random.choice(members)
+            sender.bench_sent_at = time.perf_counter()
+            sender.emit('send_message', {'message': self.next_message(sender.bench_language)})
+            self.messages_sent += 1
+
+    def run(self):
+        import eventlet
+
+        options = self.options
+        self.setup_app()
+        tracemalloc.start()
+
+        setup_started = time.perf_counter()
+        self.build_rooms()
+        setup_seconds = time.perf_counter() - setup_started
+
+        backend = self.chat_app.translator_manager.backend
+        calls_before = backend.calls
+
+        started = time.perf_counter()
+        deadline = started + options.duration
+        threads = [eventlet.spawn(self.run_room, room_id, members, deadline)
+                   for room_id, members in self.rooms]
+        for thread in threads:
+            thread.wait()
+        eventlet.sleep(0.1)  # 남은 묶음 번역 전송 대기
+        elapsed = time.perf_counter() - started
+
+        _, peak_traced = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        latencies = sorted(self.recorder.latencies)
+        translated_latencies = sorted(self.recorder.translated_latencies)
+        translator_manager = self.chat_app.translator_manager
+        translation_calls = backend.calls - calls_before
+
+        return {
+            'benchmark': 'chat_load',
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'git_revision': git_revision(),
+            'python': platform.python_version(),
+            'config': vars(options),
+            'setup_seconds': round(setup_seconds, 3),
+            'elapsed_seconds': round(elapsed, 3),
+            'messages_sent': self.messages_sent,
+            'messages_per_second': round(self.messages_sent / elapsed, 2) if elapsed else 0,
+            'deliveries': self.recorder.delivered,
+            'deliveries_per_second': round(self.recorder.delivered / elapsed, 2) if elapsed else 0,
+            'latency_ms': {
+                'p50': _ms(percentile(latencies, 50)),
+                'p90': _ms(percentile(latencies, 90)),
+                'p99': _ms(percentile(latencies, 99)),
+                'max': _ms(latencies[-1] if latencies else None),
+                'mean': _ms(sum(latencies) / len(latencies) if latencies else None)
+            },
+            'translated_latency_ms': {
+                'p50': _ms(percentile(translated_latencies, 50)),
+                'p90': _ms(percentile(translated_latencies, 90)),
+                'p99': _ms(percentile(translated_latencies, 99)),
+                'count': len(translated_latencies)
+            },
+            'translation_calls': translation_calls,
+            'translation_calls_per_message': (round(translation_calls / self.messages_sent, 3)
+                                              if self.messages_sent else 0),
+            'joins': self.joins,
+            'leaves': self.leaves,
+            'events_received': self.recorder.events,
+            'peak_memory': {
+                'traced_bytes': peak_traced,
+                'max_rss_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            },
+            'translator': {
+                'cache': translator_manager.get_cache_stats(),
+                'batch': translator_manager.get_batch_stats(),
+                'pool': translator_manager.get_pool_stats()
+            }
+        }
+
+def _ms(seconds):
+    return None if seconds is None else round(seconds * 1000, 3)
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Socket.IO 채팅 부하 벤치마크')
+    parser.add_argument('--rooms', type=int, default=10, help='방 개수')
+    parser.add_argument('--users', type=int, default=6, help='방당 사용자 수')
+    parser.add_argument('--languages', default='ko=1,en=1,ja=1', help='언어 비율 (예: ko=2,en=1,ja=1)')
+    parser.add_argument('--rate', type=float, default=2.0, help='방당 초당 메시지 수')
+    parser.add_argument('--duration', type=float, default=10.0, help='측정 시간(초)')
+    parser.add_argument('--churn', type=float, default=0.05, help='메시지마다 퇴장/재입장이 일어날 확률')
+    parser.add_argument('--unique-ratio', type=float, default=0.5, help='캐시에 걸리지 않는 고유 메시지 비율')
+    parser.add_argument('--translation-latency-ms', type=float, default=20.0, help='local 번역 백엔드 지연')
+    parser.add_argument('--seed', type=int, default=1, help='난수 시드')
+    parser.add_argument('--output', help='결과 JSON 경로 (기본: benchmarks/results/chat_load-<시각>.json)')
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    options = parse_args(argv)
+    result = ChatLoadBenchmark(options).run()
+
+    output = options.output
+    if not output:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        output = os.path.join(RESULTS_DIR, f"chat_load-{time.strftime('%Y%m%d-%H%M%S')}.json")
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(result, f, ensure_ascii=False, indent=2)
+
+    latency = result['latency_ms']
+    print(f"메시지 {result['messages_sent']}개 / {result['elapsed_seconds']}초 "
+          f"({result['messages_per_second']} msg/s, 전달 {result['deliveries_per_second']}/s)")
+    print(f"전달 지연 ms: p50={latency['p50']} p90={latency['p90']} p99={latency['p99']} max={latency['max']}")
+    translated = result['translated_latency_ms']
+    print(f"후속 번역 지연 ms: p50={translated['p50']} p90={translated['p90']} p99={translated['p99']} "
+          f"({translated['count']}건)")
+    print(f"메시지당 번역 호출: {result['translation_calls_per_message']}, "
+          f"최대 메모리: {result['peak_memory']['traced_bytes'] // 1024}KB (traced)")
+    print(f"결과 저장: {output}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,155 @@
+import atexit
+import copy
+import json
+import logging
+import logging.handlers
+import os
+import random
+import sys
+import time
+
+import os_threads
+
+_listener = None
+
+class StructuredFormatter(logging.Formatter):
+    """메시지 + key=value 필드 출력 - LOG_FORMAT=json이면 JSON 한 줄"""
+
+    def __init__(self, use_json=False):
+        super().__init__()
+        self.use_json = use_json
+
+    def format(self, record):
+        fields = getattr(record, 'fields', None) or {}
+        exc = record.exc_text or (self.formatException(record.exc_info) if record.exc_info else None)
+        timestamp = time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(record.created))
+        if self.use_json:
+            payload = {
+                'ts': f"{timestamp}.{int(record.msecs):03d}",
+                'level': record.levelname,
+                'logger': record.name,
+                'msg': record.getMessage()
+            }
+            payload.update(fields)
+            if exc:
+                payload['exc'] = exc
+            return json.dumps(payload, ensure_ascii=False, default=str)
+
+        line = f"{timestamp} {record.levelname:<7} {record.name} {record.getMessage()}"
+        if fields:
+            line += ' ' + ' '.join(f"{key}={value!r}" for key, value in fields.items())
+        if exc:
+            line += '\n' + exc
+        return line
+
+
+class StructuredLogger:
+    """필드와 샘플링을 지원하는 얇은 로거 래퍼"""
+
+    def __init__(self, name):
+        self.logger = logging.getLogger(name)
+
+    def _log(self, level, message, sample_rate=None, exc_info=False, **fields):
+        # 비활성 레벨이면 필드 포맷 비용도 들지 않게 바로 반환
+        if not self.logger.isEnabledFor(level):
+            return
+        # 대량 이벤트는 sample_rate 비율만 기록
+        if sample_rate is not None and random.random() >= sample_rate:
+            return
+        if sample_rate is not None:
+            fields['sample_rate'] = sample_rate
+        self.logger.log(level, message, exc_info=exc_info, extra={'fields': fields})
+
+    def debug(self, message, **fields):
+        self._log(logging.DEBUG, message, **fields)
+
+    def info(self, message, **fields):
+        self._log(logging.INFO, message, **fields)
+
+    def warning(self, message, **fields):
+        self._log(logging.WARNING, message, **fields)
+
+    def error(self, message, **fields):
+        self._log(logging.ERROR, message, **fields)
+
+    def exception(self, message, **fields):
+        self._log(logging.ERROR, message, exc_info=True, **fields)
+
+    def is_enabled(self, level):
+        return self.logger.isEnabledFor(level)
+
+
+class _OSLockMixin:
+    """핸들러 락을 OS 스레드 락으로 - 허브와 작업 풀 스레드가 함께 로그를 남긴다"""
+
+    def createLock(self):
+        self.lock = os_threads.RLock()
+
+
+class _StreamHandler(_OSLockMixin, logging.StreamHandler):
+    pass
+
+
+class _QueueHandler(_OSLockMixin, logging.handlers.QueueHandler):
+
+    def prepare(self, record):
+        """메시지 인자만 미리 채우고 예외는 exc_text로 따로 보관 - 기본 구현처럼 msg에 섞지 않는다"""
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None  # 트레이스백 프레임을 큐에 붙잡아 두지 않는다
+        return record
+
+
+class _QueueListener(logging.handlers.QueueListener):
+    """monkey_patch 후에도 진짜 OS 스레드에서 출력 - 그린스레드면 허브가 바쁠 때 로그가 밀린다"""
+
+    def start(self):
+        self._thread = os_threads.Thread(target=self._monitor, daemon=True)
+        self._thread.start()
+
+
+def get_logger(name):
+    """모듈별 구조화 로거 반환"""
+    return StructuredLogger(name)
+
+def parse_module_levels(spec):
+    """'translator=DEBUG,room_manager=WARNING' -> {name: level}"""
+    levels = {}
+    for item in (spec or '').split(','):
+        if '=' not in item:
+            continue
+        name, level = item.split('=', 1)
+        levels[name.strip()] = level.strip().upper()
+    return levels
+
+def setup_logging(level=None, module_levels=None, use_json=None):
+    """
+    큐 기반 비동기 로깅 설정 - 핸들러는 큐에 넣기만 하고 출력은 별도 스레드가 담당
+    LOG_LEVEL, LOG_LEVELS(모듈별), LOG_FORMAT(text|json) 환경 변수 사용
+    """
+    global _listener
+    if _listener is not None:
+        return
+
+    level = (level or os.environ.get('LOG_LEVEL', 'INFO')).upper()
+    if module_levels is None:
+        module_levels = parse_module_levels(os.environ.get('LOG_LEVELS'))
+    if use_json is None:
+        use_json = os.environ.get('LOG_FORMAT', 'text').lower() == 'json'
+
+    stream_handler = _StreamHandler(sys.stdout)
+    stream_handler.setFormatter(StructuredFormatter(use_json=use_json))
+
+    log_queue = os_threads.SimpleQueue()
+    root = logging.getLogger()
+    root.handlers = [_QueueHandler(log_queue)]
+    root.setLevel(level)
+    for name, module_level in module_levels.items():
+        logging.getLogger(name).setLevel(module_level)
+
+    _listener = _QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
@@ -0,0 +1,90 @@
+import time
+from os_threads import Lock
+
+from chat_logging import get_logger
+
+logger = get_logger(__name__)
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+STATE_CODES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}  # 지표용 숫자 값
+
+class CircuitBreaker:
+    def __init__(self, failure_threshold=5, recovery_timeout=30, half_open_max_calls=1):
+        self.failure_threshold = failure_threshold  # 연속 실패 몇 번이면 차단할지
+        self.recovery_timeout = recovery_timeout  # 차단 후 시험 호출까지 대기(초)
+        self.half_open_max_calls = half_open_max_calls  # 반개방 상태에서 허용할 시험 호출 수
+        self.lock = Lock()  # 작업 풀 스레드에서도 호출됨
+
+        self.state = CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = None
+        self.half_open_calls = 0
+
+        # 통계
+        self.successes = 0
+        self.failures = 0
+        self.rejected = 0
+        self.times_opened = 0
+
+    def allow_request(self):
+        """호출해도 되면 True - 차단 중이면 바로 False (fail fast)"""
+        with self.lock:
+            if self.state == OPEN:
+                if time.monotonic() - self.opened_at < self.recovery_timeout:
+                    self.rejected += 1
+                    return False
+                # 대기 시간이 지나면 반개방 상태로 전환해서 시험 호출 허용
+                self.state = HALF_OPEN
+                self.half_open_calls = 0
+                logger.info("번역 백엔드 차단기: 반개방 (시험 호출)")
+
+            if self.state == HALF_OPEN:
+                if self.half_open_calls >= self.half_open_max_calls:
+                    self.rejected += 1
+                    return False
+                self.half_open_calls += 1
+
+            return True
+
+    def cancel_request(self):
+        """허용받은 호출을 실제로 하지 않았을 때 반개방 시험 호출 자리를 돌려준다"""
+        with self.lock:
+            if self.state == HALF_OPEN and self.half_open_calls > 0:
+                self.half_open_calls -= 1
+
+    def record_success(self):
+        """호출 성공 기록 - 반개방 상태였다면 다시 닫힘"""
+        with self.lock:
+            self.successes += 1
+            self.consecutive_failures = 0
+            if self.state != CLOSED:
+                logger.info("번역 백엔드 차단기: 닫힘 (복구)")
+            self.state = CLOSED
+            self.half_open_calls = 0
+
+    def record_failure(self):
+        """호출 실패 기록 - 연속 실패가 기준을 넘거나 시험 호출이 실패하면 차단"""
+        with self.lock:
+            self.failures += 1
+            self.consecutive_failures += 1
+            if self.state == HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+                if self.state != OPEN:
+                    self.times_opened += 1
+                    logger.warning("번역 백엔드 차단기: 열림", consecutive_failures=self.consecutive_failures)
+                self.state = OPEN
+                self.opened_at = time.monotonic()
+                self.half_open_calls = 0
+
+    def get_stats(self):
+        """차단기 상태와 통계 반환"""
+        with self.lock:
+            return {
+                'state': self.state,
+                'consecutive_failures': self.consecutive_failures,
+                'successes': self.successes,
+                'failures': self.failures,
+                'rejected': self.rejected,
+                'times_opened': self.times_opened
+            }
@@ -0,0 +1,63 @@
+from bisect import bisect_right
+
+# 유니코드 블록 -> 문자 종류 표 (시작 코드포인트 순으로 정렬)
+SCRIPT_RANGES = [
+    (0x00C0, 0x024F, 'latin'),    # 라틴 확장 (악센트 문자)
+    (0x1100, 0x11FF, 'hangul'),   # 한글 자모
+    (0x3040, 0x309F, 'kana'),     # 히라가나
+    (0x30A0, 0x30FF, 'kana'),     # 가타카나
+    (0x3130, 0x318F, 'hangul'),   # 한글 호환 자모 (ㅋㅋ 등)
+    (0x31F0, 0x31FF, 'kana'),     # 가타카나 음성 확장
+    (0x3400, 0x4DBF, 'han'),      # 한자 확장 A
+    (0x4E00, 0x9FFF, 'han'),      # 한자
+    (0xA960, 0xA97F, 'hangul'),   # 한글 자모 확장 A
+    (0xAC00, 0xD7AF, 'hangul'),   # 한글 음절
+    (0xD7B0, 0xD7FF, 'hangul'),   # 한글 자모 확장 B
+    (0xF900, 0xFAFF, 'han'),      # 한자 호환
+    (0xFF21, 0xFF3A, 'latin'),    # 전각 라틴 대문자
+    (0xFF41, 0xFF5A, 'latin'),    # 전각 라틴 소문자
+    (0xFF66, 0xFF9F, 'kana'),     # 반각 가타카나
+]
+RANGE_STARTS = [start for start, _, _ in SCRIPT_RANGES]
+
+# 언어 코드 -> 해당 언어로 보는 문자 종류
+LANGUAGE_SCRIPTS = {
+    'ko': ('hangul',),
+    'ja': ('kana', 'han'),
+    'en': ('latin',)
+}
+
+def script_histogram(text):
+    """한 번의 순회로 문자 종류별 개수 집계 - 숫자/기호/이모지는 세지 않는다"""
+    histogram = {'hangul': 0, 'kana': 0, 'han': 0, 'latin': 0, 'other': 0}
+    for c in text:
+        code = ord(c)
+        if code < 0x80:
+            if c.isalpha():
+                histogram['latin'] += 1
+            continue
+
+        i = bisect_right(RANGE_STARTS, code) - 1
+        if i >= 0 and code <= SCRIPT_RANGES[i][1]:
+            histogram[SCRIPT_RANGES[i][2]] += 1
+        elif c.isalpha():
+            histogram['other'] += 1
+    return histogram
+
+def language_ratios(histogram):
+    """문자 종류 분포를 언어별 비율로 변환 - 글자가 없으면 빈 dict"""
+    total = sum(histogram.values())
+    if total == 0:
+        return {}
+    return {
+        lang: sum(histogram[script] for script in scripts) / total
+        for lang, scripts in LANGUAGE_SCRIPTS.items()
+    }
+
+def has_mixed_languages(text, target_lang, threshold=0.3):
+    """목표 언어가 아닌 ko/ja/en 글자가 threshold 비율을 넘으면 혼용으로 판단"""
+    ratios = language_ratios(script_histogram(text))
+    for lang, ratio in ratios.items():
+        if lang != target_lang and ratio > threshold:
+            return True
+    return False
@@ -0,0 +1,141 @@
+import time
+import uuid
+from collections import OrderedDict, deque
+from threading import Lock
+
+class HistoryEntry:
+    """방 메시지 기록 한 건 - 언어별 번역본을 함께 보관"""
+    __slots__ = ('message_id', 'nickname', 'text', 'source_lang', 'timestamp', 'translations', 'size')
+
+    def __init__(self, message_id, nickname, text, source_lang, timestamp):
+        self.message_id = message_id
+        self.nickname = nickname
+        self.text = text
+        self.source_lang = source_lang
+        self.timestamp = timestamp
+        self.translations = {}  # language: translated text
+        self.size = len(text.encode('utf-8')) + len(nickname.encode('utf-8'))
+
+    def add_translation(self, language, text):
+        """번역본 추가 - 늘어난 바이트 수 반환"""
+        if language == self.source_lang or language in self.translations:
+            return 0
+        self.translations[language] = text
+        added = len(text.encode('utf-8'))
+        self.size += added
+        return added
+
+    def text_for(self, language):
+        """해당 언어 번역본 - 없으면 원문 (새로 번역하지 않음)"""
+        if language == self.source_lang:
+            return self.text
+        return self.translations.get(language, self.text)
+
+
+class RoomHistory:
+    """방 하나의 최근 메시지 링 버퍼 - 개수와 바이트 수 둘 다 제한"""
+
+    def __init__(self, max_entries, max_bytes):
+        self.entries = deque()
+        self.index = {}  # message_id: HistoryEntry
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.total_bytes = 0
+        self.evictions = 0
+
+    def append(self, entry):
+        self.entries.append(entry)
+        self.index[entry.message_id] = entry
+        self.total_bytes += entry.size
+        self.trim()
+
+    def trim(self):
+        """한도를 넘으면 오래된 메시지부터 제거 (최신 메시지 하나는 남긴다)"""
+        while len(self.entries) > 1 and (
+            len(self.entries) > self.max_entries or self.total_bytes > self.max_bytes
+        ):
+            old = self.entries.popleft()
+            self.index.pop(old.message_id, None)
+            self.total_bytes -= old.size
+            self.evictions += 1
+
+
+class MessageHistory:
+    def __init__(self, max_entries=50, max_bytes_per_room=64 * 1024, max_rooms=1000):
+        self.max_entries = max_entries  # 방당 최대 메시지 수
+        self.max_bytes_per_room = max_bytes_per_room  # 방당 최대 바이트 (번역본 포함)
+        self.max_rooms = max_rooms  # 기록을 유지할 최대 방 수 - 넘으면 가장 오래 안 쓴 방부터 제거
+        self.rooms = OrderedDict()  # room_id: RoomHistory
+        self.lock = Lock()  # 동시성 제어
+        self.room_evictions = 0
+
+    def _get_room(self, room_id, create=False):
+        """방 기록 반환 - 락 안에서 호출"""
+        history = self.rooms.get(room_id)
+        if history is None and create:
+            history = RoomHistory(self.max_entries, self.max_bytes_per_room)
+            self.rooms[room_id] = history
+            while len(self.rooms) > self.max_rooms:
+                self.rooms.popitem(last=False)
+                self.room_evictions += 1
+        if history is not None:
+            self.rooms.move_to_end(room_id)
+        return history
+
+    def add_message(self, room_id, nickname, text, source_lang, translations=None, message_id=None):
+        """메시지 기록 - 이미 만들어진 번역본도 함께 저장하고 message_id 반환"""
+        entry = HistoryEntry(message_id or uuid.uuid4().hex, nickname, text, source_lang, time.time())
+        for language, translated in (translations or {}).items():
+            entry.add_translation(language, translated)
+
+        with self.lock:
+            self._get_room(room_id, create=True).append(entry)
+        return entry.message_id
+
+    def add_translation(self, room_id, message_id, language, text):
+        """나중에 만들어진 번역본을 기존 메시지에 추가"""
+        with self.lock:
+            history = self.rooms.get(room_id)
+            entry = history.index.get(message_id) if history else None
+            if entry is None:
+                return False
+            history.total_bytes += entry.add_translation(language, text)
+            history.trim()
+            return True
+
+    def get_recent(self, room_id, language, limit=None):
+        """최근 메시지를 해당 언어로 반환 - 번역 호출 없이 저장된 번역본만 사용"""
+        with self.lock:
+            history = self.rooms.get(room_id)
+            if history is None:
+                return []
+            entries = list(history.entries)
+
+        if limit is not None:
+            entries = entries[-limit:] if limit > 0 else []
+        return [
+            {
+                'message_id': entry.message_id,
+                'nickname': entry.nickname,
+                'message': entry.text_for(language),
+                'original_language': entry.source_lang,
+                'timestamp': entry.timestamp
+            }
+            for entry in entries
+        ]
+
+    def remove_room(self, room_id):
+        """방 기록 삭제 - 방이 사라질 때 호출"""
+        with self.lock:
+            self.rooms.pop(room_id, None)
+
+    def get_stats(self):
+        """기록 상태 반환"""
+        with self.lock:
+            return {
+                'rooms': len(self.rooms),
+                'messages': sum(len(history.entries) for history in self.rooms.values()),
+                'bytes': sum(history.total_bytes for history in self.rooms.values()),
+                'evictions': sum(history.evictions for history in self.rooms.values()),
+                'room_evictions': self.room_evictions
+            }
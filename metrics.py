@@ -0,0 +1,249 @@
+import functools
+import time
+from contextlib import contextmanager
+from os_threads import Lock
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+def _escape_label(value):
+    """라벨 값 이스케이프 - 역슬래시, 따옴표, 줄바꿈"""
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+def _format_labels(labelnames, values, extra=None):
+    """Prometheus 라벨 문자열 - {a="1",b="2"}"""
+    pairs = list(zip(labelnames, values)) + (extra or [])
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape_label(value)}"' for name, value in pairs) + '}'
+
+def _format_value(value):
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Metric:
+    type_name = 'untyped'
+
+    def __init__(self, name, description, labelnames=()):
+        self.name = name
+        self.description = description
+        self.labelnames = tuple(labelnames)
+        self.lock = Lock()  # 작업 풀 스레드에서도 갱신됨
+
+    def _key(self, labels):
+        return tuple(str(labels.get(name, '')) for name in self.labelnames)
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.description}", f"# TYPE {self.name} {self.type_name}"]
+        lines.extend(self._samples())
+        return lines
+
+    def _samples(self):
+        raise NotImplementedError
+
+
+class Counter(Metric):
+    type_name = 'counter'
+
+    def __init__(self, name, description, labelnames=(), func=None):
+        super().__init__(name, description, labelnames)
+        self.values = {}
+        self.func = func  # 다른 객체가 이미 세고 있는 누적 값을 조회 시점에 읽기 (라벨 없는 카운터만)
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with self.lock:
+            self.values[key] = self.values.get(key, 0) + amount
+
+    def _samples(self):
+        if self.func is not None:
+            try:
+                return [f"{self.name} {_format_value(self.func())}"]
+            except Exception:
+                return []
+        with self.lock:
+            items = list(self.values.items())
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}" for key, value in items]
+
+
+class Gauge(Metric):
+    type_name = 'gauge'
+
+    def __init__(self, name, description, labelnames=(), func=None):
+        super().__init__(name, description, labelnames)
+        self.values = {}
+        self.func = func  # 값을 직접 넣지 않고 조회 시점에 계산 (라벨 없는 게이지만)
+
+    def set(self, value, **labels):
+        with self.lock:
+            self.values[self._key(labels)] = value
+
+    def _samples(self):
+        if self.func is not None:
+            try:
+                return [f"{self.name} {_format_value(self.func())}"]
+            except Exception:
+                return []
+        with self.lock:
+            items = list(self.values.items())
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}" for key, value in items]
+
+
+class Histogram(Metric):
+    type_name = 'histogram'
+
+    def __init__(self, name, description, labelnames=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, description, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (float('inf'),)
+        self.values = {}  # labels: [bucket counts, sum, count]
+
+    def observe(self, value, **labels):
+        key = self._key(labels)
+        with self.lock:
+            state = self.values.get(key)
+            if state is None:
+                state = [[0] * len(self.buckets), 0.0, 0]
+                self.values[key] = state
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state[0][i] += 1
+                    break
+            state[1] += value
+            state[2] += 1
+
+    @contextmanager
+    def time(self, **labels):
+        """with 블록 실행 시간 기록"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def _samples(self):
+        with self.lock:
+            items = [(key, (list(state[0]), state[1], state[2])) for key, state in self.values.items()]
+
+        lines = []
+        for key, (counts, total, count) in items:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                labels = _format_labels(self.labelnames, key, [('le', _format_value(bound))])
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {count}")
+        return lines
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self.metrics = {}  # name: Metric
+        self.lock = Lock()
+
+    def _register(self, metric):
+        with self.lock:
+            existing = self.metrics.get(metric.name)
+            if existing is not None:
+                return existing
+            self.metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name, description, labelnames=(), func=None):
+        return self._register(Counter(name, description, labelnames, func))
+
+    def gauge(self, name, description, labelnames=(), func=None):
+        return self._register(Gauge(name, description, labelnames, func))
+
+    def histogram(self, name, description, labelnames=(), buckets=DEFAULT_BUCKETS):
+        return self._register(Histogram(name, description, labelnames, buckets))
+
+    def render(self):
+        """Prometheus 텍스트 형식으로 출력"""
+        with self.lock:
+            metrics = list(self.metrics.values())
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return '\n'.join(lines) + '\n'
+
+
+# 기본 레지스트리와 공용 지표
+registry = MetricsRegistry()
+
+translation_latency = registry.histogram(
+    'translation_latency_seconds',
+    'End-to-end translation latency (cache, queueing and backend) by source/target language',
+    ('source', 'target')
+)
+translation_backend_latency = registry.histogram(
+    'translation_backend_latency_seconds',
+    'Translation backend call latency by source/target language',
+    ('source', 'target')
+)
+translation_retries = registry.counter(
+    'translation_retries_total',
+    'Translation attempts retried after an error or failed validation',
+    ('source', 'target')
+)
+translation_validation_failures = registry.counter(
+    'translation_validation_failures_total',
+    'Translations rejected by validation',
+    ('source', 'target')
+)
+handler_duration = registry.histogram(
+    'socketio_handler_duration_seconds',
+    'Socket.IO handler duration',
+    ('handler',)
+)
+fanout_recipients = registry.histogram(
+    'message_fanout_recipients',
+    'Recipients per sent message',
+    buckets=(1, 2, 5, 10, 20, 50, 100, 200, 500)
+)
+fanout_languages = registry.histogram(
+    'message_fanout_languages',
+    'Distinct target languages per sent message',
+    buckets=(1, 2, 3, 4, 5, 10)
+)
+socket_events_throttled = registry.counter(
+    'socketio_events_throttled_total',
+    'Socket.IO events rejected by the per-connection rate limit',
+    ('event',)
+)
+outbound_events_dropped = registry.counter(
+    'outbound_events_dropped_total',
+    'Events dropped from slow consumer outbound queues',
+    ('event', 'reason')
+)
+translation_fast_path = registry.counter(
+    'translation_fast_path_total',
+    'Messages delivered untranslated because they have no translatable text (emoji, URLs, numbers, laughter)'
+)
+translation_chunks = registry.histogram(
+    'translation_message_chunks',
+    'Sentence chunks per long message translated chunk by chunk',
+    buckets=(2, 4, 8, 16, 32)
+)
+translation_queue_wait = registry.histogram(
+    'translation_queue_wait_seconds',
+    'Time translation jobs waited for a worker by priority class',
+    ('priority',)
+)
+translation_jobs_dropped = registry.counter(
+    'translation_jobs_dropped_total',
+    'Translation jobs dropped before running (expired or no recipients left)',
+    ('priority', 'reason')
+)
+
+def timed_handler(handler_name):
+    """Socket.IO 핸들러 실행 시간을 handler_duration에 기록하는 데코레이터"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with handler_duration.time(handler=handler_name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
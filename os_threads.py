@@ -0,0 +1,17 @@
+"""
+eventlet.monkey_patch() 이전의 원래 threading/time/queue
+
+허브(그린스레드)와 번역 작업 풀(tpool) OS 스레드가 함께 쓰는 객체는 그린 락 대신 이 모듈의 락을 쓴다
+그린 락은 다른 OS 스레드에서 기다리면 깨워 줄 허브가 없어 멈출 수 있다
+허브에서만 쓰는 객체(방/사용자 관리 등)는 그대로 threading을 써서 Redis I/O 중에도 다른 그린스레드가 돌게 한다
+"""
+from eventlet.patcher import original
+
+_threading = original('threading')
+
+Lock = _threading.Lock
+RLock = _threading.RLock
+local = _threading.local  # OS 스레드별 값 (그린스레드별이 아님)
+Thread = _threading.Thread
+sleep = original('time').sleep  # 작업 풀 스레드 안에서 허브를 거치지 않고 대기
+SimpleQueue = original('queue').SimpleQueue
@@ -0,0 +1,137 @@
+import collections
+import eventlet
+from threading import Lock
+
+import metrics
+from chat_logging import get_logger
+
+logger = get_logger(__name__)
+
+DROP_OLDEST = 'drop_oldest'
+COALESCE = 'coalesce'
+DISCONNECT = 'disconnect'
+POLICIES = (DROP_OLDEST, COALESCE, DISCONNECT)
+
+class OutboundQueues:
+    """
+    느린 수신자용 송신 큐 - 전송 대기가 쌓인 연결은 방 브로드캐스트에서 빼고
+    연결별 제한된 큐에 모았다가 전송 대기가 줄면 순서대로 보낸다
+    큐가 가득 차면 정책에 따라 가장 오래된 것 버리기 / 같은 종류 합치기 / 연결 끊기
+    """
+
+    def __init__(self, socketio, max_size=100, policy=DROP_OLDEST, slow_threshold=50,
+                 check_interval=0.5, namespace='/'):
+        if policy not in POLICIES:
+            raise ValueError(f"알 수 없는 송신 큐 정책: {policy}")
+        self.socketio = socketio
+        self.max_size = max_size  # 연결별 대기 이벤트 최대 수
+        self.policy = policy
+        self.slow_threshold = slow_threshold  # 전송 대기 패킷이 이만큼 쌓이면 느린 수신자
+        self.check_interval = check_interval  # 느린 수신자 점검 주기(초)
+        self.namespace = namespace
+        self.pending = {}  # sid: deque[(event, data, coalesce_key)] - 느린 수신자만
+        self.lock = Lock()  # 동시성 제어
+        self.monitor = None
+
+        # 통계
+        self.dropped = 0
+        self.coalesced = 0
+        self.disconnected = 0
+
+    def start(self):
+        """느린 수신자 점검 그린스레드 시작"""
+        if self.monitor is None:
+            self.monitor = eventlet.spawn(self._run)
+
+    def emit(self, event, data, room, skip_sid=None, coalesce_key=None):
+        """방 브로드캐스트 - 느린 수신자는 건너뛰고 각자의 큐에 넣는다"""
+        skip = [skip_sid] if skip_sid else []
+        if self.pending:
+            members = self.socketio.server.manager.rooms.get(self.namespace, {}).get(room, {})
+            with self.lock:
+                slow = [sid for sid in self.pending if sid in members and sid != skip_sid]
+                for sid in slow:
+                    self._enqueue(sid, event, data, coalesce_key)
+            skip.extend(slow)
+        self.socketio.emit(event, data, to=room, skip_sid=skip or None, namespace=self.namespace)
+
+    def _enqueue(self, sid, event, data, coalesce_key):
+        """lock 보유 상태에서 호출"""
+        queue = self.pending[sid]
+        if coalesce_key is not None and self.policy == COALESCE:
+            # 같은 종류의 이전 이벤트는 최신 것으로 대체
+            for index, item in enumerate(queue):
+                if item[2] == coalesce_key:
+                    del queue[index]
+                    self.coalesced += 1
+                    metrics.outbound_events_dropped.inc(event=event, reason=COALESCE)
+                    break
+
+        if len(queue) >= self.max_size:
+            if self.policy == DISCONNECT:
+                self._disconnect_later(sid)
+                return
+            dropped = queue.popleft()
+            self.dropped += 1
+            metrics.outbound_events_dropped.inc(event=dropped[0], reason='overflow')
+        queue.append((event, data, coalesce_key))
+
+    def _disconnect_later(self, sid):
+        """송신 큐 초과 연결 종료 - 브로드캐스트 중이므로 별도 그린스레드에서"""
+        self.pending.pop(sid, None)
+        self.disconnected += 1
+        metrics.outbound_events_dropped.inc(event='*', reason=DISCONNECT)
+        logger.warning("송신 큐 초과로 연결 종료", session_id=sid)
+        eventlet.spawn(self.socketio.server.disconnect, sid, namespace=self.namespace)
+
+    def _backlog(self, eio_sid):
+        """engine.io 소켓의 전송 대기 패킷 수"""
+        socket = self.socketio.server.eio.sockets.get(eio_sid)
+        return socket.queue.qsize() if socket is not None else 0
+
+    def check(self):
+        """느린 수신자 표시/해제 - 대기가 절반 아래로 줄면 모아 둔 이벤트 전송"""
+        manager = self.socketio.server.manager
+        connected = manager.rooms.get(self.namespace, {}).get(None, {})  # sid: eio_sid
+        ready = []
+        with self.lock:
+            for sid, eio_sid in list(connected.items()):
+                backlog = self._backlog(eio_sid)
+                if sid not in self.pending:
+                    if backlog >= self.slow_threshold:
+                        self.pending[sid] = collections.deque()
+                        logger.info("느린 수신자 감지", session_id=sid, backlog=backlog)
+                elif backlog < self.slow_threshold // 2:
+                    ready.append((sid, self.pending.pop(sid)))
+            # 이미 끊긴 연결의 큐 정리
+            for sid in [sid for sid in self.pending if sid not in connected]:
+                del self.pending[sid]
+
+        for sid, queue in ready:
+            for event, data, _ in queue:
+                self.socketio.emit(event, data, to=sid, namespace=self.namespace)
+
+    def _run(self):
+        while True:
+            eventlet.sleep(self.check_interval)
+            try:
+                self.check()
+            except Exception as e:
+                logger.exception("송신 큐 점검 오류", error=str(e))
+
+    def count_slow(self):
+        """현재 느린 수신자 수"""
+        return len(self.pending)
+
+    def get_stats(self):
+        """송신 큐 상태 반환"""
+        with self.lock:
+            return {
+                'policy': self.policy,
+                'max_size': self.max_size,
+                'slow_consumers': len(self.pending),
+                'queued': sum(len(queue) for queue in self.pending.values()),
+                'dropped': self.dropped,
+                'coalesced': self.coalesced,
+                'disconnected': self.disconnected
+            }
@@ -0,0 +1,100 @@
+import time
+from threading import Lock
+
+import os_threads
+
+class TokenBucket:
+    def __init__(self, rate, capacity):
+        self.rate = rate  # 초당 채워지는 토큰 수
+        self.capacity = capacity  # 최대 토큰 수 (순간 허용량)
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+        self.lock = os_threads.Lock()  # 작업 풀 스레드에서도 호출됨
+
+        # 통계
+        self.allowed = 0
+        self.throttled = 0
+
+    def _refill(self, now):
+        """지난 시간만큼 토큰 채우기 - 락 안에서 호출"""
+        elapsed = now - self.updated_at
+        if elapsed > 0:
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+            self.updated_at = now
+
+    def try_acquire(self, tokens=1):
+        """토큰이 있으면 사용하고 True, 없으면 바로 False"""
+        with self.lock:
+            self._refill(time.monotonic())
+            if self.tokens >= tokens:
+                self.tokens -= tokens
+                self.allowed += 1
+                return True
+            self.throttled += 1
+            return False
+
+    def acquire(self, tokens=1, timeout=0):
+        """토큰이 생길 때까지 최대 timeout초 대기 - 작업 풀 스레드에서만 사용"""
+        deadline = time.monotonic() + timeout
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    self.allowed += 1
+                    return True
+                wait = (tokens - self.tokens) / self.rate if self.rate > 0 else timeout
+                if now + wait > deadline:
+                    self.throttled += 1
+                    return False
+            os_threads.sleep(wait)
+
+    def get_stats(self):
+        """토큰 버킷 상태 반환"""
+        with self.lock:
+            self._refill(time.monotonic())
+            return {
+                'rate': self.rate,
+                'capacity': self.capacity,
+                'tokens': round(self.tokens, 2),
+                'allowed': self.allowed,
+                'throttled': self.throttled
+            }
+
+
+class ConnectionRateLimiter:
+    """연결(sid)별 이벤트 토큰 버킷 - {event: (초당 허용 수, 순간 허용량)}"""
+
+    def __init__(self, limits):
+        self.limits = limits
+        self.buckets = {}  # (sid, event): TokenBucket
+        self.lock = Lock()
+
+    def allow(self, sid, event):
+        """이번 이벤트를 처리해도 되면 True - 제한이 없는 이벤트는 항상 True"""
+        limit = self.limits.get(event)
+        if limit is None:
+            return True
+        key = (sid, event)
+        bucket = self.buckets.get(key)
+        if bucket is None:
+            with self.lock:
+                bucket = self.buckets.setdefault(key, TokenBucket(*limit))
+        return bucket.try_acquire()
+
+    def remove(self, sid):
+        """연결 종료 시 버킷 정리"""
+        with self.lock:
+            for event in self.limits:
+                self.buckets.pop((sid, event), None)
+
+    def get_stats(self):
+        """이벤트별 허용/제한 합계"""
+        with self.lock:
+            buckets = list(self.buckets.items())
+        stats = {event: {'allowed': 0, 'throttled': 0} for event in self.limits}
+        for (_, event), bucket in buckets:
+            stats[event]['allowed'] += bucket.allowed
+            stats[event]['throttled'] += bucket.throttled
+        return stats
@@ -0,0 +1,162 @@
+import eventlet
+from threading import Lock
+
+# 저장소 키 - 방 목록이 바뀔 때마다 증가하는 버전 (프로세스 간 공유)
+ROOMS_VERSION_KEY = 'rooms_version'
+
+SORT_KEYS = {
+    'created': lambda room: room.get('created_at') or 0,
+    'title': lambda room: room['title'].lower(),
+    'user_count': lambda room: room['user_count']
+}
+
+class RoomDirectory:
+    def __init__(self, store, loader, flush_interval=0.5):
+        self.store = store
+        self.loader = loader  # 저장소에서 전체 방 목록을 다시 만드는 함수
+        self.flush_interval = flush_interval  # 변경 사항을 모아서 보내는 간격(초)
+        self.on_delta = None  # rooms_delta 전송 콜백 (app에서 설정)
+        self.lock = Lock()  # 동시성 제어
+
+        # 증분 갱신되는 스냅샷
+        self.rooms = {}  # room_id: room_summary
+        self.version = None  # 스냅샷 버전 - None이면 아직 만들지 않음
+        self.sorted_views = {}  # (sort, reverse): [room_summary] - 버전이 바뀌면 비움
+
+        # 아직 보내지 않은 변경 사항
+        self.pending = None
+        self.flush_timer = None
+
+    def _reset_pending(self, from_version):
+        self.pending = {
+            'from_version': from_version,
+            'version': from_version,
+            'created': {},
+            'updated': {},
+            'deleted': set()
+        }
+
+    def _record_change(self, apply_change, record_delta):
+        """버전을 올리고 스냅샷/대기 중인 delta에 변경 반영"""
+        with self.lock:
+            version = self.store.incr(ROOMS_VERSION_KEY)
+
+            # 스냅샷이 바로 이전 버전이면 제자리 갱신, 아니면 다음 조회 때 다시 만든다
+            if self.version is not None and version == self.version + 1:
+                apply_change()
+                self.version = version
+            else:
+                self.version = None
+            self.sorted_views.clear()
+
+            # 그 사이 다른 프로세스가 버전을 가져갔으면 지금까지의 delta는 따로 보내고 새로 시작
+            # (delta가 다른 프로세스의 버전 구간까지 덮으면 클라이언트가 그쪽 delta를 버린다)
+            interrupted = None
+            if self.pending is not None and version != self.pending['version'] + 1:
+                interrupted = self.pending
+                self.pending = None
+
+            if self.pending is None:
+                self._reset_pending(version - 1)
+            record_delta(self.pending)
+            self.pending['version'] = version
+
+            if self.on_delta and self.flush_timer is None:
+                self.flush_timer = eventlet.spawn_after(self.flush_interval, self.flush)
+
+        if interrupted is not None:
+            self._emit(interrupted)
+
+    def room_created(self, room):
+        """방 생성 반영"""
+        def apply_change():
+            self.rooms[room['id']] = room
+
+        def record_delta(delta):
+            delta['created'][room['id']] = room
+
+        self._record_change(apply_change, record_delta)
+
+    def room_updated(self, room_id, user_count):
+        """방 인원 변경 반영"""
+        def apply_change():
+            if room_id in self.rooms:
+                self.rooms[room_id] = dict(self.rooms[room_id], user_count=user_count)
+
+        def record_delta(delta):
+            if room_id in delta['created']:
+                delta['created'][room_id] = dict(delta['created'][room_id], user_count=user_count)
+            else:
+                delta['updated'][room_id] = user_count
+
+        self._record_change(apply_change, record_delta)
+
+    def room_deleted(self, room_id):
+        """방 삭제 반영"""
+        def apply_change():
+            self.rooms.pop(room_id, None)
+
+        def record_delta(delta):
+            delta['updated'].pop(room_id, None)
+            if delta['created'].pop(room_id, None) is None:
+                delta['deleted'].add(room_id)
+
+        self._record_change(apply_change, record_delta)
+
+    def flush(self):
+        """모인 변경 사항을 rooms_delta 한 번으로 전송"""
+        with self.lock:
+            self.flush_timer = None
+            delta = self.pending
+            self.pending = None
+        self._emit(delta)
+
+    def _emit(self, delta):
+        """delta 하나를 rooms_delta 형식으로 전송 - 락 밖에서 호출"""
+        if not delta or not self.on_delta:
+            return
+
+        self.on_delta({
+            'from_version': delta['from_version'],
+            'version': delta['version'],
+            'created': list(delta['created'].values()),
+            'updated': [
+                {'id': room_id, 'user_count': user_count}
+                for room_id, user_count in delta['updated'].items()
+            ],
+            'deleted': list(delta['deleted'])
+        })
+
+    def _ensure_snapshot(self):
+        """스냅샷이 저장소 버전과 다르면 다시 만든다 - 락 안에서 호출"""
+        current_version = self.store.get_counter(ROOMS_VERSION_KEY)
+        if self.version != current_version:
+            self.rooms = {room['id']: room for room in self.loader()}
+            self.version = current_version
+            self.sorted_views.clear()
+
+    def get_rooms(self, sort='created', reverse=False):
+        """(버전, 정렬된 방 목록) 반환 - 정렬 결과는 버전이 바뀔 때까지 재사용"""
+        if sort not in SORT_KEYS:
+            sort = 'created'
+        with self.lock:
+            self._ensure_snapshot()
+            view = self.sorted_views.get((sort, reverse))
+            if view is None:
+                view = sorted(self.rooms.values(), key=SORT_KEYS[sort], reverse=reverse)
+                self.sorted_views[(sort, reverse)] = view
+            return self.version, view
+
+    def get_page(self, sort='created', reverse=False, page=1, per_page=None):
+        """페이지 단위 조회 - {version, total, rooms}, per_page가 없으면 전체"""
+        version, rooms = self.get_rooms(sort, reverse)
+        if per_page:
+            start = (max(page, 1) - 1) * per_page
+            page_rooms = rooms[start:start + per_page]
+        else:
+            page_rooms = list(rooms)
+        return {
+            'version': version,
+            'total': len(rooms),
+            'rooms': page_rooms
+        }
@@ -1,14 +1,43 @@
 import uuid
 import hashlib
-import eventlet
+import time
 from threading import Lock
 
+from state_store import InMemoryStateStore
+from room_directory import RoomDirectory
+from timer_wheel import TimerWheel
+from chat_logging import get_logger
+
+logger = get_logger(__name__)
+
+# 저장소 키
+ROOMS_KEY = 'chat_rooms'  # 해시 - room_id: room_info
+
+ROOM_LOCK_STRIPES = 64  # 방별 락 개수 - room_id 해시로 나눠 써서 다른 방끼리는 서로 막지 않음
+
+ROOM_CLEANUP = 'room_cleanup'  # 만료 예약 종류 - 빈 방 삭제
+
+def room_users_key(room_id):
+    """방 사용자 집합 키 - {user_session_ids}"""
+    return f"room_users:{room_id}"
+
 class RoomManager:
-    def __init__(self):
-        self.chat_rooms = {}  # room_id: room_info
-        self.room_users = {}  # room_id: {user_session_ids}
-        self.pending_room_cleanup = {}  # room_id -> eventlet timer
-        self.lock = Lock()  # 동시성 제어
+    def __init__(self, store=None):
+        self.store = store or InMemoryStateStore()  # 방/방 사용자 저장소 (프로세스 간 공유 가능)
+        self.expirations = TimerWheel(tick=1.0)  # 빈 방 삭제 등 만료 예약 (프로세스 로컬)
+        
+        # 락 순서: 방 락 -> 방 목록 락 (반대로 잡지 않는다)
+        # monkey_patch 후 threading.Lock은 그린 락 - Redis 저장소 I/O로 양보하는 동안에도 다른 그린스레드를 막는다
+        self.lock = Lock()  # 방 목록 락 - 방 생성/삭제
+        self.room_locks = [Lock() for _ in range(ROOM_LOCK_STRIPES)]  # 방별 락 - 입장/퇴장
+        
+        # 로비용 방 목록 - 증분 갱신 + 버전 관리
+        self.directory = RoomDirectory(self.store, self._build_rooms_list)
+        self.on_room_deleted = None  # 방이 실제로 삭제될 때 호출할 콜백 (room_id)
+    
+    def _room_lock(self, room_id):
+        """room_id에 해당하는 방별 락"""
+        return self.room_locks[hash(room_id) % len(self.room_locks)]
     
     def hash_password(self, password):
         """비밀번호 해시화 - 수정된 버전"""
@@ -36,126 +65,133 @@ class RoomManager:
             room_id = str(uuid.uuid4())
             hashed_password = self.hash_password(password)
             
-            self.chat_rooms[room_id] = {
+            room_info = {
                 'id': room_id,
                 'title': title,
                 'password': hashed_password,
                 'created_by': created_by,
-                'created_at': str(uuid.uuid4()),
+                'created_at': time.time(),
                 'max_users': int(max_users)
             }
+            self.store.hset(ROOMS_KEY, room_id, room_info)
+            self.directory.room_created(self._room_summary(room_info, 0))
             
-            self.room_users[room_id] = set()
-            
-            print(f"방 생성 완료: {room_id} - {title}")
-            print(f"비밀번호 설정: {'있음' if hashed_password else '없음'}")
+            logger.info("방 생성 완료", room_id=room_id, title=title, has_password=bool(hashed_password))
             
             return room_id
     
     def join_room(self, room_id, user_session_id, password=None):
-        """방 입장 시도"""
-        with self.lock:
-            if room_id not in self.chat_rooms:
+        """방 입장 시도 - 같은 방의 입장/퇴장만 직렬화"""
+        with self._room_lock(room_id):
+            room_info = self.store.hget(ROOMS_KEY, room_id)
+            if room_info is None:
                 return False, 'Room does not exist'
             
-            room_info = self.chat_rooms[room_id]
-            
             # 비밀번호 확인 - 수정된 로직
             if not self.verify_password(password, room_info['password']):
-                print(f"비밀번호 불일치: 입력='{password}', 저장된 해시='{room_info['password']}'")
+                logger.info("비밀번호 불일치", room_id=room_id, session_id=user_session_id)
                 return False, 'Incorrect password'
             
-            # 최대 사용자 수 확인
-            if len(self.room_users.get(room_id, set())) >= room_info['max_users']:
+            # 방 입장 처리 - 먼저 넣어 보고 최대 인원을 넘으면 되돌린다
+            # (다른 프로세스와 동시에 입장해도 정원을 넘지 않도록)
+            added = self.store.sadd(room_users_key(room_id), user_session_id)
+            user_count = self.store.scard(room_users_key(room_id))
+            if added and user_count > room_info['max_users']:
+                self.store.srem(room_users_key(room_id), user_session_id)
                 return False, 'Room is full'
             
-            # 방 입장 처리
-            if room_id not in self.room_users:
-                self.room_users[room_id] = set()
-            
-            self.room_users[room_id].add(user_session_id)
-            
             # 누군가 들어왔으니 삭제 예약 취소
             self.cancel_room_cleanup(room_id)
             
-            print(f"사용자 입장 성공: {user_session_id} -> {room_id}")
-            print(f"현재 방 인원: {len(self.room_users[room_id])}")
+            if added:
+                self.directory.room_updated(room_id, user_count)
+            
+            logger.debug("사용자 입장 성공", room_id=room_id, session_id=user_session_id, user_count=user_count)
             
             return True, 'Success'
     
     def leave_room(self, room_id, user_session_id):
         """방 퇴장 처리"""
-        with self.lock:
-            if room_id not in self.room_users:
-                return
-            
+        with self._room_lock(room_id):
             # 사용자 제거 - 중복 제거 방지
-            if user_session_id in self.room_users[room_id]:
-                self.room_users[room_id].remove(user_session_id)
-                print(f"사용자 퇴장: {user_session_id} <- {room_id}")
-                print(f"남은 인원: {len(self.room_users[room_id])}")
+            if self.store.srem(room_users_key(room_id), user_session_id):
+                user_count = self.store.scard(room_users_key(room_id))
+                logger.debug("사용자 퇴장", room_id=room_id, session_id=user_session_id, user_count=user_count)
+                self.directory.room_updated(room_id, user_count)
             
             # 방이 비어있으면 삭제 예약
-            if len(self.room_users[room_id]) == 0:
+            if self.store.hexists(ROOMS_KEY, room_id) and self.store.scard(room_users_key(room_id)) == 0:
                 self.schedule_room_cleanup(room_id, delay=6)
     
     def get_room_users(self, room_id):
-        """방의 사용자 목록 반환 - 정리된 버전"""
-        if room_id not in self.room_users:
-            return set()
-        return self.room_users[room_id].copy()  # 복사본 반환으로 동시성 이슈 방지
+        """방의 사용자 목록 반환 - 락 없이 읽는 일관된 스냅샷 (수정하지 말 것)"""
+        return self.store.smembers(room_users_key(room_id))
+    
+    def _room_summary(self, room_info, user_count):
+        """로비에 보여줄 방 요약 정보"""
+        return {
+            'id': room_info['id'],
+            'title': room_info['title'],
+            'has_password': bool(room_info['password']),
+            'user_count': user_count,
+            'max_users': room_info.get('max_users', 50),
+            'created_by': room_info['created_by'],
+            'created_at': room_info.get('created_at')
+        }
+    
+    def _build_rooms_list(self):
+        """저장소에서 전체 방 목록을 새로 만든다 - 방 목록 스냅샷이 오래됐을 때만 사용"""
+        # RoomDirectory 락 안에서 호출되므로 RoomManager 락을 잡지 않는다 (락 순서 역전 방지)
+        return [
+            self._room_summary(room_info, self.store.scard(room_users_key(room_id)))
+            for room_id, room_info in self.store.hgetall(ROOMS_KEY).items()
+        ]
     
     def get_rooms_list(self):
-        """활성 채팅방 목록 반환"""
-        with self.lock:
-            rooms_list = []
-            for room_id, room_info in self.chat_rooms.items():
-                user_count = len(self.room_users.get(room_id, set()))
-                rooms_list.append({
-                    'id': room_id,
-                    'title': room_info['title'],
-                    'has_password': bool(room_info['password']),
-                    'user_count': user_count,
-                    'max_users': room_info.get('max_users', 50),
-                    'created_by': room_info['created_by']
-                })
-            return rooms_list
+        """활성 채팅방 목록 반환 - 스냅샷을 재사용하므로 매번 다시 만들지 않음"""
+        _, rooms = self.directory.get_rooms()
+        return list(rooms)
+    
+    def count_rooms(self):
+        """활성 채팅방 수"""
+        return self.store.hlen(ROOMS_KEY)
     
     def room_exists(self, room_id):
         """방 존재 여부 확인"""
-        return room_id in self.chat_rooms
+        return self.store.hexists(ROOMS_KEY, room_id)
     
     def get_room_info(self, room_id):
         """방 정보 반환"""
-        return self.chat_rooms.get(room_id)
+        return self.store.hget(ROOMS_KEY, room_id)
     
     def cancel_room_cleanup(self, room_id):
         """해당 방의 삭제 예약이 있으면 취소"""
-        timer = self.pending_room_cleanup.pop(room_id, None)
-        if timer:
-            try:
-                timer.cancel()
-                print(f"방 삭제 예약 취소: {room_id}")
-            except Exception:
-                pass
+        if self.expirations.cancel((ROOM_CLEANUP, room_id)):
+            logger.debug("방 삭제 예약 취소", room_id=room_id)
+    
+    def count_pending_cleanups(self):
+        """삭제 대기 중인 빈 방 수"""
+        return self.expirations.count_pending(ROOM_CLEANUP)
     
     def cleanup_room_if_still_empty(self, room_id):
         """유예 시간 후에도 방이 여전히 비었으면 실제 삭제"""
-        with self.lock:
-            try:
-                if room_id in self.room_users and len(self.room_users[room_id]) == 0:
-                    title = self.chat_rooms.get(room_id, {}).get('title', '')
-                    self.chat_rooms.pop(room_id, None)
-                    self.room_users.pop(room_id, None)
-                    print(f"방 삭제됨(유예 만료): {room_id} - {title}")
-                else:
-                    print(f"방 삭제 취소(재입장 감지): {room_id}")
-            finally:
-                self.pending_room_cleanup.pop(room_id, None)
+        # 방 락으로 같은 방의 입장과 겹치지 않게 하고, 삭제 자체는 방 목록 락 안에서
+        with self._room_lock(room_id):
+            if self.store.scard(room_users_key(room_id)) == 0:
+                with self.lock:
+                    room_info = self.store.hdel(ROOMS_KEY, room_id) or {}
+                    self.store.delete(room_users_key(room_id))
+                title = room_info.get('title', '')
+                logger.info("방 삭제됨(유예 만료)", room_id=room_id, title=title)
+                if room_info:
+                    self.directory.room_deleted(room_id)
+                if self.on_room_deleted:
+                    self.on_room_deleted(room_id)
+            else:
+                logger.debug("방 삭제 취소(재입장 감지)", room_id=room_id)
     
     def schedule_room_cleanup(self, room_id, delay=59):
-        """빈 방을 delay초 뒤 삭제 예약"""
-        self.cancel_room_cleanup(room_id)  # 중복 예약 방지
-        t = eventlet.spawn_after(delay, self.cleanup_room_if_still_empty, room_id)
-        self.pending_room_cleanup[room_id] = t
-        print(f"빈 방 감지 → {room_id} {self.chat_rooms.get(room_id, {}).get('title','')} : {delay}초 후 삭제 예약")
\ No newline at end of file
+        """빈 방을 delay초 뒤 삭제 예약 - 같은 방의 이전 예약은 교체된다"""
+        self.expirations.schedule((ROOM_CLEANUP, room_id), delay,
+                                  lambda: self.cleanup_room_if_still_empty(room_id))
+        logger.debug("빈 방 삭제 예약", room_id=room_id, delay=delay)
\ No newline at end of file
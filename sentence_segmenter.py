@@ -0,0 +1,59 @@
+import re
+
+from language_detector import script_histogram
+
+# 문장 경계 후보 - 일본어 마침표류는 공백 없이도, 라틴 마침표류는 뒤에 공백이 있을 때만, 줄바꿈은 항상
+BOUNDARY_PATTERN = re.compile(
+    r'[。！？]+[」』）)"\']*\s*'
+    r'|[.!?…]+[)"\'\]」』）]*\s+'
+    r'|\n\s*'
+)
+
+# 뒤에 마침표가 와도 문장이 끝나지 않는 영어 약어
+ABBREVIATIONS = {
+    'mr', 'mrs', 'ms', 'dr', 'prof', 'sr', 'jr', 'st', 'vs', 'etc', 'e.g', 'i.e',
+    'inc', 'ltd', 'co', 'no', 'fig', 'approx', 'a.m', 'p.m', 'u.s'
+}
+
+def _is_latin_boundary(text, start, end):
+    """라틴 마침표(. ! ?) 뒤가 문장 끝인지 - 앞 글자의 문자 종류와 약어/다음 글자로 판단"""
+    before = text[:start]
+    if not before:
+        return False
+    previous = before[-1]
+    if not previous.isascii() and any(script_histogram(previous).values()):
+        return True  # 한글/가나/한자 뒤의 마침표는 공백만 있으면 문장 끝 (대소문자가 없음)
+    parts = before.rsplit(None, 1)
+    word = parts[-1].lower() if parts else ''  # 앞에 공백만 있으면 단어 없음
+    if text[start] == '.' and (word in ABBREVIATIONS or (len(word) == 1 and word.isalpha())):
+        return False  # 약어, 이름 머리글자 (J. K.)
+    following = text[end:end + 1]
+    if following.isascii() and following.islower():
+        return False  # 소문자로 이어지면 같은 문장 (wait... what)
+    return True
+
+def split_sentences(text):
+    """
+    한국어/영어/일본어 문장 단위로 나눈다 - 조각을 그대로 이으면 원문과 같다
+    각 조각은 문장과 그 뒤의 공백/줄바꿈을 포함한다
+    """
+    pieces = []
+    last = 0
+    for match in BOUNDARY_PATTERN.finditer(text):
+        end = match.end()
+        if end >= len(text):
+            break
+        marker = match.group(0)
+        if marker[0] in '.!?…' and not _is_latin_boundary(text, match.start(), end):
+            continue
+        pieces.append(text[last:end])
+        last = end
+    pieces.append(text[last:])
+    return [piece for piece in pieces if piece]
+
+def merge_pieces(pieces, max_pieces):
+    """조각이 너무 많으면 이웃한 조각을 합쳐 max_pieces개 이하로 - 번역 동시 요청 수 제한"""
+    if len(pieces) <= max_pieces:
+        return pieces
+    size = -(-len(pieces) // max_pieces)  # 올림
+    return [''.join(pieces[i:i + size]) for i in range(0, len(pieces), size)]
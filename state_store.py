@@ -0,0 +1,188 @@
+import json
+import os
+from threading import Lock
+
+from chat_logging import get_logger
+
+logger = get_logger(__name__)
+
+class InMemoryStateStore:
+    """프로세스 내부 저장소 - 단일 프로세스 기본값"""
+
+    def __init__(self):
+        self.hashes = {}  # name: {field: value}
+        self.sets = {}  # key: frozenset(members) - 쓰기 때마다 새로 만드는 copy-on-write
+        self.counters = {}  # key: int
+        self.lock = Lock()  # 동시성 제어
+
+    # 해시 - 값은 dict 등 그대로 저장
+    def hget(self, name, field):
+        return self.hashes.get(name, {}).get(field)
+
+    def hmget(self, name, fields):
+        table = self.hashes.get(name, {})
+        return [table.get(field) for field in fields]
+
+    def hset(self, name, field, value):
+        with self.lock:
+            self.hashes.setdefault(name, {})[field] = value
+
+    def hdel(self, name, field):
+        """필드 삭제 - 삭제된 값 반환 (없으면 None)"""
+        with self.lock:
+            return self.hashes.get(name, {}).pop(field, None)
+
+    def hgetall(self, name):
+        with self.lock:
+            return dict(self.hashes.get(name, {}))
+
+    def hexists(self, name, field):
+        return field in self.hashes.get(name, {})
+
+    def hlen(self, name):
+        return len(self.hashes.get(name, {}))
+
+    # 집합 - 쓰기는 락 안에서 새 frozenset으로 교체, 읽기는 락 없이 현재 스냅샷 반환
+    def sadd(self, key, member):
+        """멤버 추가 - 새로 추가됐으면 True"""
+        with self.lock:
+            members = self.sets.get(key, frozenset())
+            if member in members:
+                return False
+            self.sets[key] = members | {member}
+            return True
+
+    def srem(self, key, member):
+        """멤버 제거 - 실제로 제거됐으면 True"""
+        with self.lock:
+            members = self.sets.get(key)
+            if not members or member not in members:
+                return False
+            if len(members) == 1:
+                del self.sets[key]
+            else:
+                self.sets[key] = members - {member}
+            return True
+
+    def smembers(self, key):
+        """현재 멤버 스냅샷 (frozenset) - 복사 없이 반환"""
+        return self.sets.get(key, frozenset())
+
+    def scard(self, key):
+        return len(self.sets.get(key, ()))
+
+    # 카운터
+    def incr(self, key, amount=1):
+        with self.lock:
+            self.counters[key] = self.counters.get(key, 0) + amount
+            return self.counters[key]
+
+    def get_counter(self, key):
+        return self.counters.get(key, 0)
+
+    def delete(self, *keys):
+        """키 삭제 - 해시/집합/카운터 구분 없음"""
+        with self.lock:
+            for key in keys:
+                self.hashes.pop(key, None)
+                self.sets.pop(key, None)
+                self.counters.pop(key, None)
+
+
+class RedisStateStore:
+    """Redis 프로토콜 저장소 - 여러 워커 프로세스가 같은 방/사용자 상태를 공유"""
+
+    def __init__(self, url=None, client=None, prefix='multilang:'):
+        if client is None:
+            import redis
+            client = redis.Redis.from_url(url, decode_responses=True)
+        self.client = client  # redis.Redis 호환 클라이언트 (fakeredis 포함)
+        self.prefix = prefix
+
+    def _key(self, key):
+        return self.prefix + key
+
+    @staticmethod
+    def _encode(value):
+        # to_dict()가 있는 레코드 객체(UserRecord 등)는 dict로 저장
+        return json.dumps(value, ensure_ascii=False, default=lambda obj: obj.to_dict())
+
+    @staticmethod
+    def _decode(raw):
+        if raw is None:
+            return None
+        if isinstance(raw, bytes):
+            raw = raw.decode('utf-8')
+        return json.loads(raw)
+
+    @staticmethod
+    def _member(raw):
+        return raw.decode('utf-8') if isinstance(raw, bytes) else raw
+
+    # 해시 - 값은 JSON으로 저장
+    def hget(self, name, field):
+        return self._decode(self.client.hget(self._key(name), field))
+
+    def hmget(self, name, fields):
+        fields = list(fields)
+        if not fields:
+            return []
+        return [self._decode(raw) for raw in self.client.hmget(self._key(name), fields)]
+
+    def hset(self, name, field, value):
+        self.client.hset(self._key(name), field, self._encode(value))
+
+    def hdel(self, name, field):
+        """필드 삭제 - 삭제된 값 반환 (없으면 None)"""
+        pipe = self.client.pipeline()
+        pipe.hget(self._key(name), field)
+        pipe.hdel(self._key(name), field)
+        raw, _ = pipe.execute()
+        return self._decode(raw)
+
+    def hgetall(self, name):
+        return {
+            self._member(field): self._decode(raw)
+            for field, raw in self.client.hgetall(self._key(name)).items()
+        }
+
+    def hexists(self, name, field):
+        return bool(self.client.hexists(self._key(name), field))
+
+    def hlen(self, name):
+        return self.client.hlen(self._key(name))
+
+    # 집합
+    def sadd(self, key, member):
+        return self.client.sadd(self._key(key), member) == 1
+
+    def srem(self, key, member):
+        return self.client.srem(self._key(key), member) == 1
+
+    def smembers(self, key):
+        return {self._member(member) for member in self.client.smembers(self._key(key))}
+
+    def scard(self, key):
+        return self.client.scard(self._key(key))
+
+    # 카운터
+    def incr(self, key, amount=1):
+        return self.client.incrby(self._key(key), amount)
+
+    def get_counter(self, key):
+        value = self.client.get(self._key(key))
+        return int(value) if value is not None else 0
+
+    def delete(self, *keys):
+        if keys:
+            self.client.delete(*(self._key(key) for key in keys))
+
+
+def create_state_store(url=None):
+    """설정(STATE_STORE_URL 환경 변수)에 맞는 저장소 생성 - redis:// 이면 Redis, 없으면 메모리"""
+    url = url or os.environ.get('STATE_STORE_URL')
+    if url and url.startswith(('redis://', 'rediss://', 'unix://')):
+        logger.info("상태 저장소: Redis")
+        return RedisStateStore(url=url)
+    logger.info("상태 저장소: 메모리")
+    return InMemoryStateStore()
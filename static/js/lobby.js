@@ -5,6 +5,10 @@
     let connected = false;
     let currentUser = {};
   
+    // 방 목록 스냅샷 - 서버가 보내는 rooms_delta로 증분 갱신
+    let rooms = new Map();
+    let roomsVersion = null;
+  
     let pendingRoomId = null;
     let pendingRoomPassword = '';
     let selectedLanguage = null;
@@ -64,15 +68,39 @@
   
     socket.on('connect', () => {
       connected = true;
+      socket.emit('join_lobby');
       loadRooms();
     });
   
+    // ★ 방 목록 변경 푸시 - 버전이 이어지지 않으면 전체 목록 다시 받기
+    socket.on('rooms_delta', (delta) => {
+      if (!delta) return;
+      if (roomsVersion !== null && delta.version <= roomsVersion) return;
+      if (roomsVersion === null || delta.from_version !== roomsVersion) {
+        loadRooms();
+        return;
+      }
+  
+      (delta.created || []).forEach(room => rooms.set(room.id, room));
+      (delta.updated || []).forEach(({ id, user_count }) => {
+        const room = rooms.get(id);
+        if (room) room.user_count = user_count;
+      });
+      (delta.deleted || []).forEach(id => rooms.delete(id));
+      roomsVersion = delta.version;
+      renderRooms();
+    });
+  
     socket.on('connected', (data) => {
       if (data && data.user) {
         currentUser = data.user || {};
       }
     });
   
+    socket.on('rate_limited', (data) => {
+      if (data?.event === 'create_room') alert('Too many rooms created. Please wait a moment.');
+    });
+  
     socket.on('create_room_error', (err) => {
       alert(err?.message || 'Failed to create room');
     });
@@ -162,52 +190,16 @@
     }
   
     function loadRooms() {
+      // 서버 ETag로 재검증 - 바뀐 게 없으면 304로 본문 생략
       fetch('/api/rooms', { credentials: 'same-origin' })
-        .then(res => res.json())
-        .then(rooms => {
-          const list = $('roomList');
-          if (!list) return;
-  
-          list.innerHTML = '';
-          if (!rooms || rooms.length === 0) {
-            list.innerHTML = `
-              <div class="empty-state">
-                <div class="empty-state-icon">💬</div>
-                <p>No chat rooms available.</p>
-              </div>`;
-            return;
-          }
-  
-          rooms.forEach(room => {
-            const item = document.createElement('div');
-            item.className = 'room-item';
-            item.dataset.roomId = room.id;
-            item.dataset.hasPassword = String(room.has_password);
-  
-            item.innerHTML = `
-              <div class="room-title">${room.title}</div>
-              <div class="room-info">
-                <span class="room-password">${room.has_password ? '🔒 Private' : 'Public'}</span>
-                <span class="room-users">${room.user_count}/${room.max_users} users</span>
-              </div>`;
-  
-            item.addEventListener('click', () => {
-              pendingRoomId = room.id;
-              pendingRoomPassword = '';
-  
-              if (room.has_password) {
-                $('passwordModal').style.display = 'block';
-              } else {
-                if (!currentUser.language) {
-                  showLanguageModal();
-                } else {
-                  socket.emit('join_room_request', { room_id: room.id });
-                }
-              }
-            });
-  
-            list.appendChild(item);
-          });
+        .then(res => {
+          const version = parseInt(res.headers.get('X-Rooms-Version'), 10);
+          return res.json().then(list => ({ list, version }));
+        })
+        .then(({ list, version }) => {
+          rooms = new Map((list || []).map(room => [room.id, room]));
+          roomsVersion = Number.isNaN(version) ? null : version;
+          renderRooms();
         })
         .catch(err => {
           console.error(err);
@@ -215,6 +207,52 @@
         });
     }
   
+    function renderRooms() {
+      const list = $('roomList');
+      if (!list) return;
+  
+      list.innerHTML = '';
+      if (rooms.size === 0) {
+        list.innerHTML = `
+          <div class="empty-state">
+            <div class="empty-state-icon">💬</div>
+            <p>No chat rooms available.</p>
+          </div>`;
+        return;
+      }
+  
+      rooms.forEach(room => {
+        const item = document.createElement('div');
+        item.className = 'room-item';
+        item.dataset.roomId = room.id;
+        item.dataset.hasPassword = String(room.has_password);
+  
+        item.innerHTML = `
+          <div class="room-title">${room.title}</div>
+          <div class="room-info">
+            <span class="room-password">${room.has_password ? '🔒 Private' : 'Public'}</span>
+            <span class="room-users">${room.user_count}/${room.max_users} users</span>
+          </div>`;
+  
+        item.addEventListener('click', () => {
+          pendingRoomId = room.id;
+          pendingRoomPassword = '';
+  
+          if (room.has_password) {
+            $('passwordModal').style.display = 'block';
+          } else {
+            if (!currentUser.language) {
+              showLanguageModal();
+            } else {
+              socket.emit('join_room_request', { room_id: room.id });
+            }
+          }
+        });
+  
+        list.appendChild(item);
+      });
+    }
+  
     function showLanguageModal() {
       selectedLanguage = null;
       document.querySelectorAll('.language-option').forEach(opt => opt.classList.remove('selected'));
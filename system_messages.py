@@ -0,0 +1,49 @@
+import json
+import os
+
+from chat_logging import get_logger
+
+logger = get_logger(__name__)
+
+# 기본 시스템 메시지 - {nickname} 자리에 닉네임이 들어간다
+DEFAULT_MESSAGES = {
+    'user_joined': {
+        'ko': '{nickname}님이 채팅방에 입장했습니다.',
+        'en': '{nickname} joined the chat room.',
+        'ja': '{nickname}さんがチャットルームに入室しました。'
+    },
+    'user_left': {
+        'ko': '{nickname}님이 채팅방에서 나갔습니다.',
+        'en': '{nickname} left the chat room.',
+        'ja': '{nickname}さんがチャットルームから退室しました。'
+    }
+}
+
+class SystemMessageCatalog:
+    def __init__(self, path=None, default_language='en'):
+        self.default_language = default_language
+        self.messages = {key: dict(templates) for key, templates in DEFAULT_MESSAGES.items()}
+
+        # 파일이 지정되면 기본 메시지를 덮어쓴다
+        path = path or os.environ.get('SYSTEM_MESSAGES_FILE')
+        if path:
+            self.load_file(path)
+
+    def load_file(self, path):
+        """JSON 파일에서 메시지 템플릿 로드 - {key: {lang: template}}"""
+        try:
+            with open(path, encoding='utf-8') as f:
+                loaded = json.load(f)
+            for key, templates in loaded.items():
+                self.messages.setdefault(key, {}).update(templates)
+            logger.info("시스템 메시지 로드 완료", path=path)
+        except Exception as e:
+            logger.error("시스템 메시지 로드 오류", path=path, error=str(e))
+
+    def render(self, key, language, **params):
+        """언어에 맞는 템플릿에 값을 채워 반환 - 번역 호출 없음"""
+        templates = self.messages.get(key, {})
+        template = templates.get(language) or templates.get(self.default_language)
+        if template is None:
+            return key
+        return template.format(**params)
@@ -0,0 +1,96 @@
+import fakeredis
+import pytest
+
+from room_manager import RoomManager
+from state_store import RedisStateStore
+from user_manager import UserManager
+
+
+@pytest.fixture(params=[True, False], ids=['decoded', 'bytes'])
+def server_and_options(request):
+    return fakeredis.FakeServer(), {'decode_responses': request.param}
+
+
+def make_store(server_and_options):
+    server, options = server_and_options
+    return RedisStateStore(client=fakeredis.FakeRedis(server=server, **options))
+
+
+@pytest.fixture
+def store(server_and_options):
+    return make_store(server_and_options)
+
+
+def test_room_lifecycle(store):
+    rooms = RoomManager(store)
+    room_id = rooms.create_room('general', 'secret', 2, 'alice')
+
+    assert rooms.room_exists(room_id)
+    assert rooms.get_room_info(room_id)['title'] == 'general'
+    assert rooms.join_room(room_id, 'sid-1', 'wrong') == (False, 'Incorrect password')
+    assert rooms.join_room(room_id, 'sid-1', 'secret') == (True, 'Success')
+    assert rooms.join_room(room_id, 'sid-2', 'secret') == (True, 'Success')
+    assert rooms.join_room(room_id, 'sid-3', 'secret') == (False, 'Room is full')
+    assert rooms.get_room_users(room_id) == {'sid-1', 'sid-2'}
+    assert rooms.get_rooms_list()[0]['user_count'] == 2
+
+    rooms.leave_room(room_id, 'sid-1')
+    rooms.leave_room(room_id, 'sid-2')
+    assert rooms.count_pending_cleanups() == 1
+
+    deleted = []
+    rooms.on_room_deleted = deleted.append
+    rooms.cleanup_room_if_still_empty(room_id)
+    assert not rooms.room_exists(room_id)
+    assert deleted == [room_id]
+    assert rooms.count_rooms() == 0
+
+
+def test_rooms_shared_between_processes(server_and_options):
+    first = RoomManager(make_store(server_and_options))
+    second = RoomManager(make_store(server_and_options))
+
+    room_id = first.create_room('shared', '', 1, 'alice')
+    assert second.join_room(room_id, 'sid-1') == (True, 'Success')
+    assert first.join_room(room_id, 'sid-2') == (False, 'Room is full')
+    assert first.get_room_users(room_id) == {'sid-1'}
+
+
+def test_user_language_index(store):
+    users = UserManager(store)
+    alice = users.add_user('sid-1', {'id': 'g1', 'name': 'alice'})
+    users.add_user('sid-2', {'id': 'g2', 'name': 'bob'})
+    users.set_user_language('sid-1', 'ko')
+    users.set_user_language('sid-2', 'en')
+    users.set_user_room('sid-1', 'room')
+    users.set_user_room('sid-2', 'room')
+
+    assert users.get_user('sid-1').user_id == alice.user_id
+    assert users.get_language_groups('room') == {'ko': {'sid-1'}, 'en': {'sid-2'}}
+    assert sorted(member['nickname'] for member in users.get_room_members('room')) == ['alice', 'bob']
+
+    users.set_user_language('sid-2', 'ko')
+    assert users.get_language_groups('room') == {'ko': {'sid-1', 'sid-2'}}
+
+    users.remove_user('sid-1')
+    assert users.get_language_users('room', 'ko') == {'sid-2'}
+    assert users.count_users() == 1
+
+
+def test_presence_version_and_ghosts(store):
+    users = UserManager(store)
+    assert users.bump_presence_version('room') == 1
+    assert users.bump_presence_version('room') == 2
+
+    users.add_user('sid-1', {'id': 'g1', 'name': 'alice'})
+    users.set_user_language('sid-1', 'ja')
+    users.set_user_room('sid-1', 'room')
+    snapshot = users.get_presence_snapshot('room')
+    assert snapshot['version'] == 2
+    assert [member['nickname'] for member in snapshot['members']] == ['alice']
+
+    assert users.clean_ghost_users(active_sessions=set()) == 1
+    assert users.get_language_groups('room') == {}
+
+    users.clear_room_presence('room')
+    assert users.get_presence_snapshot('room')['version'] == 0
@@ -0,0 +1,77 @@
+import fakeredis
+
+from room_manager import RoomManager
+from state_store import InMemoryStateStore, RedisStateStore
+
+
+def make_manager(store):
+    rooms = RoomManager(store)
+    deltas = []
+    rooms.directory.on_delta = deltas.append
+    rooms.directory.flush_interval = 3600  # 테스트에서 직접 flush
+    return rooms, deltas
+
+
+def test_changes_are_merged_into_one_delta():
+    rooms, deltas = make_manager(InMemoryStateStore())
+    room_id = rooms.create_room('general', '', 5, 'alice')
+    rooms.join_room(room_id, 'sid-1')
+    rooms.directory.flush()
+
+    assert len(deltas) == 1
+    delta = deltas[0]
+    assert (delta['from_version'], delta['version']) == (0, 2)
+    assert [room['id'] for room in delta['created']] == [room_id]
+    assert delta['created'][0]['user_count'] == 1  # 같은 delta 안의 인원 변경은 created에 합친다
+    assert delta['updated'] == [] and delta['deleted'] == []
+
+
+def test_versions_continue_across_flushes():
+    rooms, deltas = make_manager(InMemoryStateStore())
+    room_id = rooms.create_room('general', '', 5, 'alice')
+    rooms.directory.flush()
+    rooms.join_room(room_id, 'sid-1')
+    rooms.directory.flush()
+    rooms.leave_room(room_id, 'sid-1')
+    rooms.cleanup_room_if_still_empty(room_id)
+    rooms.directory.flush()
+
+    assert [(d['from_version'], d['version']) for d in deltas] == [(0, 1), (1, 2), (2, 4)]
+    assert deltas[1]['updated'] == [{'id': room_id, 'user_count': 1}]
+    assert deltas[2]['deleted'] == [room_id] and deltas[2]['updated'] == []
+    assert rooms.directory.get_rooms()[0] == 4
+
+
+def test_created_then_deleted_room_is_not_sent():
+    rooms, deltas = make_manager(InMemoryStateStore())
+    room_id = rooms.create_room('short lived', '', 5, 'alice')
+    rooms.cleanup_room_if_still_empty(room_id)
+    rooms.directory.flush()
+
+    assert deltas[0]['created'] == [] and deltas[0]['deleted'] == []
+
+
+def test_deltas_never_cover_other_process_versions():
+    server = fakeredis.FakeServer()
+    first, first_deltas = make_manager(RedisStateStore(client=fakeredis.FakeRedis(server=server)))
+    second, second_deltas = make_manager(RedisStateStore(client=fakeredis.FakeRedis(server=server)))
+
+    a1 = first.create_room('a1', '', 5, 'alice')    # 버전 1
+    b1 = second.create_room('b1', '', 5, 'bob')     # 버전 2
+    a2 = first.create_room('a2', '', 5, 'alice')    # 버전 3
+    first.directory.flush()
+    second.directory.flush()
+
+    ranges = sorted(
+        (d['from_version'], d['version'], [room['id'] for room in d['created']])
+        for d in first_deltas + second_deltas
+    )
+    assert ranges == [(0, 1, [a1]), (1, 2, [b1]), (2, 3, [a2])]
+
+    # 버전 순서대로 이어 붙이는 클라이언트는 모든 방을 받는다
+    client_version, client_rooms = 0, set()
+    for from_version, version, created in ranges:
+        assert from_version == client_version
+        client_rooms.update(created)
+        client_version = version
+    assert client_rooms == {a1, b1, a2}
@@ -0,0 +1,53 @@
+import pytest
+
+from sentence_segmenter import merge_pieces, split_sentences
+
+
+@pytest.mark.parametrize('text', [
+    ' ... hello there. Next',
+    '\n' + '. hello world this is a long paste. ' * 20,
+    '   ! Wow. Yes',
+    '. ',
+])
+def test_leading_whitespace_before_terminator(text):
+    assert ''.join(split_sentences(text)) == text
+
+
+def test_english_sentences():
+    assert split_sentences("Hello there. How are you? I'm fine!") == [
+        'Hello there. ', 'How are you? ', "I'm fine!"
+    ]
+
+
+def test_english_abbreviations_and_initials():
+    text = 'Mr. Smith met Dr. Jones at 3.30 p.m. today. J. K. Rowling wrote it. Yes.'
+    assert split_sentences(text) == [
+        'Mr. Smith met Dr. Jones at 3.30 p.m. today. ', 'J. K. Rowling wrote it. ', 'Yes.'
+    ]
+
+
+def test_lowercase_continuation_is_same_sentence():
+    assert split_sentences('Wait... what? Ok.') == ['Wait... what? ', 'Ok.']
+
+
+def test_korean_sentences():
+    assert split_sentences('안녕하세요. 오늘 날씨가 좋네요! 뭐 해요? 저는 집에 있어요.') == [
+        '안녕하세요. ', '오늘 날씨가 좋네요! ', '뭐 해요? ', '저는 집에 있어요.'
+    ]
+
+
+def test_cjk_punctuation_without_spaces():
+    assert split_sentences('今日は。元気ですか？「はい！」そうです。') == [
+        '今日は。', '元気ですか？', '「はい！」', 'そうです。'
+    ]
+
+
+def test_newlines_always_split():
+    assert split_sentences('line one\nline two\n\nline three') == [
+        'line one\n', 'line two\n\n', 'line three'
+    ]
+
+
+def test_merge_pieces_bounds_count():
+    assert merge_pieces(list('abcdefg'), 3) == ['abc', 'def', 'g']
+    assert merge_pieces(['a', 'b'], 3) == ['a', 'b']
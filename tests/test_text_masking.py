@@ -0,0 +1,61 @@
+from text_masking import is_translatable, mask, placeholders_intact
+
+
+def test_mask_restore_round_trip():
+    text = 'see `make test` at https://example.com/docs?x=1, thanks @bob 😀'
+    masked = mask(text)
+
+    assert masked.text == 'see ⟦0⟧ at ⟦1⟧, thanks ⟦2⟧ ⟦3⟧'
+    assert masked.spans == ['`make test`', 'https://example.com/docs?x=1', '@bob', '😀']
+    assert masked.restore(masked.text) == text
+
+
+def test_restore_after_translation_reorders_placeholders():
+    masked = mask('ask @alice about ```print(1)```')
+    translated = '⟦1⟧ 관해 ⟦0⟧에게 물어보세요'
+
+    assert masked.restore(translated) == '```print(1)``` 관해 @alice에게 물어보세요'
+
+
+def test_typed_placeholder_literals_are_kept():
+    text = 'use ⟦0⟧ and ⟦ 1 ⟧ as markers for @carol'
+    masked = mask(text)
+
+    assert masked.spans == ['⟦0⟧', '⟦ 1 ⟧', '@carol']
+    assert masked.restore(masked.text) == text
+    # 번역기가 만든 자리표시자 공백 변형도 되돌린다
+    assert masked.restore('⟦ 0 ⟧ と ⟦1⟧ を ⟦2⟧ に') == '⟦0⟧ と ⟦ 1 ⟧ を @carol に'
+
+
+def test_restore_leaves_unknown_placeholders():
+    masked = mask('hi @dave')
+    assert masked.restore('⟦0⟧ ⟦7⟧') == '@dave ⟦7⟧'
+
+
+def test_plain_text_is_unchanged():
+    masked = mask('안녕하세요 여러분')
+    assert masked.text == '안녕하세요 여러분' and masked.spans == []
+    assert masked.restore('hello everyone') == 'hello everyone'
+
+
+def test_placeholders_intact():
+    masked = mask('ping @erin and @frank')
+
+    assert placeholders_intact(masked.text, '⟦1⟧ 그리고 ⟦0⟧ 호출')
+    assert placeholders_intact(masked.text, '⟦ 0 ⟧ ⟦1⟧')
+    assert not placeholders_intact(masked.text, '⟦0⟧ 호출')  # 빠짐
+    assert not placeholders_intact(masked.text, '⟦0⟧ ⟦0⟧ ⟦1⟧')  # 중복
+    assert not placeholders_intact(masked.text, '⟦0⟧ ⟦2⟧')  # 다른 번호
+    assert placeholders_intact('no markers', 'still none')
+
+
+def test_is_translatable():
+    assert is_translatable('hello world')
+    assert is_translatable('안녕 @bob')
+    assert is_translatable('ありがとう 😀')
+    assert not is_translatable('ㅋㅋㅋㅋ')
+    assert not is_translatable('lol 😂😂')
+    assert not is_translatable('hahaha!!! 123')
+    assert not is_translatable('https://example.com @bob `code`')
+    assert not is_translatable('⟦0⟧ ⟦1⟧')
+    assert not is_translatable('')
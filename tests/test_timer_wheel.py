@@ -0,0 +1,70 @@
+import eventlet
+
+from timer_wheel import TimerWheel
+
+
+def advance(wheel, ticks):
+    """휠을 ticks칸 돌리며 (몇 번째 칸, 키) 목록 반환 - 스위퍼 없이 직접 구동"""
+    fired = []
+    for tick in range(1, ticks + 1):
+        fired.extend((tick, key) for key, _ in wheel._advance())
+    return fired
+
+
+def test_fires_after_delay():
+    wheel = TimerWheel(tick=1.0, slots=8)
+    wheel.schedule(('room_cleanup', 'a'), 3, lambda: None)
+    wheel.schedule(('room_cleanup', 'b'), 0.2, lambda: None)  # 최소 한 칸 뒤
+
+    assert advance(wheel, 8) == [(1, ('room_cleanup', 'b')), (3, ('room_cleanup', 'a'))]
+    assert wheel.count_pending() == 0
+
+
+def test_wraps_around_end_of_wheel():
+    wheel = TimerWheel(tick=1.0, slots=4)
+    advance(wheel, 3)  # 마지막 칸
+    wheel.schedule(('room_cleanup', 'a'), 2, lambda: None)
+
+    assert wheel.entries[('room_cleanup', 'a')] == 1
+    assert advance(wheel, 4) == [(2, ('room_cleanup', 'a'))]
+
+
+def test_delay_longer_than_wheel_waits_extra_rounds():
+    wheel = TimerWheel(tick=1.0, slots=4)
+    wheel.schedule(('room_cleanup', 'a'), 10, lambda: None)  # 두 바퀴 넘게
+    wheel.schedule(('room_cleanup', 'b'), 4, lambda: None)  # 정확히 한 바퀴
+
+    assert advance(wheel, 12) == [(4, ('room_cleanup', 'b')), (10, ('room_cleanup', 'a'))]
+
+
+def test_cancel():
+    wheel = TimerWheel(tick=1.0, slots=4)
+    wheel.schedule(('room_cleanup', 'a'), 2, lambda: None)
+
+    assert wheel.cancel(('room_cleanup', 'a'))
+    assert not wheel.cancel(('room_cleanup', 'a'))
+    assert not wheel.is_scheduled(('room_cleanup', 'a'))
+    assert advance(wheel, 8) == []
+    assert wheel.get_stats()['cancelled'] == 1
+
+
+def test_reschedule_replaces_existing_entry():
+    wheel = TimerWheel(tick=1.0, slots=4)
+    wheel.schedule(('room_cleanup', 'a'), 2, lambda: None)
+    wheel.schedule(('room_cleanup', 'a'), 7, lambda: None)
+
+    assert wheel.count_pending('room_cleanup') == 1
+    assert advance(wheel, 8) == [(7, ('room_cleanup', 'a'))]
+
+
+def test_sweeper_runs_callbacks_and_stops_when_empty():
+    wheel = TimerWheel(tick=0.01, slots=4)
+    calls = []
+    wheel.schedule(('room_cleanup', 'a'), 0.01, lambda: calls.append('a'))
+    wheel.schedule(('room_cleanup', 'b'), 0.02, lambda: 1 / 0)  # 오류가 나도 다음 작업은 계속
+
+    eventlet.sleep(0.1)
+
+    assert calls == ['a']
+    assert wheel.get_stats()['fired'] == 2
+    assert wheel.sweeper is None
@@ -0,0 +1,43 @@
+from translation_cache import TranslationCache
+from translation_store import TranslationStore
+
+
+def make_cache(tmp_path, **store_options):
+    store = TranslationStore(str(tmp_path / 'translations.db'), **store_options)
+    return TranslationCache(max_size=100, ttl=0, store=store), store
+
+
+def test_memory_hits_are_recorded_in_store(tmp_path):
+    cache, store = make_cache(tmp_path)
+    cache.set('hello', 'en', 'ko', '안녕')
+    cache.set('bye', 'en', 'ko', '잘 가')
+    for _ in range(3):
+        assert cache.get('hello', 'en', 'ko') == '안녕'  # 메모리에서만 쓰임
+
+    assert store.get_stats()['pending_hits'] == 1
+    store.flush_hits()
+    assert [row[0] for row in store.hottest(2)] == ['hello', 'bye']
+
+
+def test_memory_hits_protect_entries_from_eviction(tmp_path):
+    cache, store = make_cache(tmp_path, max_entries=2, evict_every=3)
+    cache.set('hello', 'en', 'ko', '안녕')
+    cache.get('hello', 'en', 'ko')
+    cache.set('bye', 'en', 'ko', '잘 가')
+    cache.set('thanks', 'en', 'ko', '고마워')  # 세 번째 쓰기에서 정리 - 쓰이지 않은 것부터
+
+    assert store.count() == 2
+    assert store.get('hello', 'en', 'ko') == '안녕'
+    assert store.get('bye', 'en', 'ko') is None
+
+
+def test_pending_hits_flush_from_worker_side_calls(tmp_path):
+    cache, store = make_cache(tmp_path, hit_flush_every=2)
+    cache.set('hello', 'en', 'ko', '안녕')
+    cache.set('bye', 'en', 'ko', '잘 가')
+    cache.get('hello', 'en', 'ko')
+    cache.get('bye', 'en', 'ko')
+    assert store.get_stats()['pending_hits'] == 2  # 허브 쪽 get은 기록하지 않는다
+
+    cache.set('thanks', 'en', 'ko', '고마워')
+    assert store.get_stats()['pending_hits'] == 0
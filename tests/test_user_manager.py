@@ -0,0 +1,32 @@
+from state_store import InMemoryStateStore
+from user_manager import UserManager
+
+
+def join(users, session_id, google_id, name, language, room_id='room'):
+    users.add_user(session_id, {'id': google_id, 'name': name})
+    users.set_user_language(session_id, language)
+    users.set_user_room(session_id, room_id)
+
+
+def test_members_are_deduplicated_by_account():
+    users = UserManager(InMemoryStateStore())
+    join(users, 'sid-1', 'g-alice', 'alice', 'ko')
+    join(users, 'sid-2', 'g-alice', 'alice', 'ko')  # 같은 계정의 두 번째 탭
+    join(users, 'sid-3', 'g-bob', 'bob', 'en')
+
+    members = users.get_room_members('room')
+    assert sorted(member['nickname'] for member in members) == ['alice', 'bob']
+    assert users.get_user('sid-1').member_id == users.get_user('sid-2').member_id
+    assert users.get_user('sid-1').member_id != users.get_user('sid-3').member_id
+
+
+def test_find_account_session_ignores_leaving_session():
+    users = UserManager(InMemoryStateStore())
+    join(users, 'sid-1', 'g-alice', 'alice', 'ko')
+    join(users, 'sid-2', 'g-alice', 'alice', 'ja')
+
+    assert users.find_account_session('room', 'g-alice', exclude_sid='sid-1').language == 'ja'
+
+    users.remove_user('sid-2')
+    assert users.find_account_session('room', 'g-alice', exclude_sid='sid-1') is None
+    assert users.find_account_session('room', 'g-bob') is None
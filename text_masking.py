@@ -0,0 +1,64 @@
+import re
+
+from language_detector import script_histogram
+
+# 번역하면 안 되는 구간 - 코드 블록, 인라인 코드, URL, @멘션, 이모지 묶음
+# 사용자가 직접 입력한 자리표시자 모양 문자열도 가려서 그대로 되돌린다
+PROTECTED_PATTERN = re.compile(
+    r'```.*?```'
+    r'|`[^`\n]+`'
+    r'|(?:https?://|www\.)[^\s<>"]*[^\s<>".,!?)\]]'
+    r'|(?<![\w@])@[\w.-]*\w'
+    r'|[\U0001F000-\U0001FAFF\u2600-\u27BF\u2B00-\u2BFF\uFE0F\u200D]+'
+    r'|⟦\s*\d+\s*⟧',
+    re.DOTALL
+)
+
+# 웃음/감정 표현 - 한글 자모만 있는 구간(ㅋㅋ, ㅠㅠ), lol/haha/www 등
+LAUGHTER_PATTERN = re.compile(
+    r'[\u3130-\u318F]+'
+    r'|(?<!\w)(?:lol+|lmao+|(?:ha){2,}h?|(?:he){2,}|w{2,}|笑+|草)(?!\w)',
+    re.IGNORECASE
+)
+
+# 가린 구간 대신 넣는 자리표시자 - 번역기가 글자로 보지 않고 그대로 두는 모양
+PLACEHOLDER = '⟦{}⟧'
+PLACEHOLDER_PATTERN = re.compile(r'⟦\s*(\d+)\s*⟧')
+
+def is_translatable(text):
+    """가릴 구간과 웃음 표현, 숫자/기호를 빼고도 글자가 남으면 True - 남지 않으면 번역 없이 그대로 보낸다"""
+    remaining = LAUGHTER_PATTERN.sub(' ', PROTECTED_PATTERN.sub(' ', text))
+    return any(script_histogram(remaining).values())
+
+class MaskedText:
+    """자리표시자로 가린 텍스트와 가린 원래 구간 - 번역/캐시는 text로, 결과는 restore로 복원"""
+    __slots__ = ('text', 'spans')
+
+    def __init__(self, text, spans):
+        self.text = text
+        self.spans = spans
+
+    def restore(self, translated):
+        """번역 결과의 자리표시자를 원래 구간으로 되돌린다"""
+        if not self.spans:
+            return translated
+
+        def replace(match):
+            index = int(match.group(1))
+            return self.spans[index] if index < len(self.spans) else match.group(0)
+        return PLACEHOLDER_PATTERN.sub(replace, translated)
+
+def mask(text):
+    """보호 구간을 ⟦0⟧, ⟦1⟧ ... 으로 바꾼 MaskedText 반환 - 같은 입력이면 항상 같은 결과"""
+    spans = []
+
+    def replace(match):
+        spans.append(match.group(0))
+        return PLACEHOLDER.format(len(spans) - 1)
+    return MaskedText(PROTECTED_PATTERN.sub(replace, text), spans)
+
+def placeholders_intact(masked_text, translated):
+    """가린 텍스트의 자리표시자가 번역 결과에 빠짐없이 한 번씩 남아 있는지"""
+    expected = sorted(PLACEHOLDER_PATTERN.findall(masked_text), key=int)
+    found = sorted(PLACEHOLDER_PATTERN.findall(translated), key=int)
+    return [int(i) for i in expected] == [int(i) for i in found]
@@ -0,0 +1,106 @@
+import eventlet
+from threading import Lock
+
+from chat_logging import get_logger
+
+logger = get_logger(__name__)
+
+class TimerWheel:
+    """
+    해시 타이머 휠 - 만료 예약을 그린스레드 하나가 tick마다 모아서 처리
+    schedule/cancel은 O(1), 키는 (종류, id) 튜플 (예: ('room_cleanup', room_id))
+    """
+
+    def __init__(self, tick=1.0, slots=64):
+        self.tick = tick  # 휠 한 칸의 시간(초)
+        self.slots = [{} for _ in range(slots)]  # 칸별 {key: [rounds, callback]}
+        self.entries = {}  # key: 칸 번호
+        self.current = 0  # 현재 칸
+        self.lock = Lock()  # 동시성 제어
+        self.sweeper = None  # 예약이 있을 때만 도는 그린스레드
+
+        # 통계
+        self.fired = 0
+        self.cancelled = 0
+
+    def schedule(self, key, delay, callback):
+        """delay초 뒤 callback() 실행 예약 - 같은 키가 있으면 교체"""
+        ticks = max(1, int(-(-delay // self.tick)))  # 올림, 최소 한 칸 뒤
+        with self.lock:
+            self._remove(key)
+            slot = (self.current + ticks) % len(self.slots)
+            rounds = (ticks - 1) // len(self.slots)  # 휠을 몇 바퀴 더 돌아야 하는지
+            self.slots[slot][key] = [rounds, callback]
+            self.entries[key] = slot
+            if self.sweeper is None:
+                self.sweeper = eventlet.spawn(self._run)
+
+    def cancel(self, key):
+        """예약 취소 - 취소됐으면 True"""
+        with self.lock:
+            if self._remove(key):
+                self.cancelled += 1
+                return True
+            return False
+
+    def _remove(self, key):
+        """lock 보유 상태에서 호출"""
+        slot = self.entries.pop(key, None)
+        if slot is None:
+            return False
+        del self.slots[slot][key]
+        return True
+
+    def is_scheduled(self, key):
+        return key in self.entries
+
+    def _advance(self):
+        """한 칸 전진하고 만료된 콜백 목록 반환"""
+        with self.lock:
+            self.current = (self.current + 1) % len(self.slots)
+            bucket = self.slots[self.current]
+            expired = []
+            for key, entry in list(bucket.items()):
+                if entry[0] > 0:
+                    entry[0] -= 1
+                    continue
+                del bucket[key]
+                del self.entries[key]
+                expired.append((key, entry[1]))
+            return expired
+
+    def _run(self):
+        """tick마다 휠을 돌리며 만료된 작업 실행 - 예약이 모두 없어지면 종료"""
+        while True:
+            eventlet.sleep(self.tick)
+            for key, callback in self._advance():
+                self.fired += 1
+                try:
+                    callback()
+                except Exception as e:
+                    logger.exception("만료 작업 오류", key=str(key), error=str(e))
+            with self.lock:
+                if not self.entries:
+                    self.sweeper = None
+                    return
+
+    def count_pending(self, kind=None):
+        """대기 중인 만료 수 - kind를 주면 해당 종류만"""
+        if kind is None:
+            return len(self.entries)
+        return sum(1 for key in list(self.entries) if key[0] == kind)
+
+    def get_stats(self):
+        """만료 예약 통계 반환"""
+        with self.lock:
+            pending_by_kind = {}
+            for key in self.entries:
+                pending_by_kind[key[0]] = pending_by_kind.get(key[0], 0) + 1
+            return {
+                'pending': len(self.entries),
+                'pending_by_kind': pending_by_kind,
+                'fired': self.fired,
+                'cancelled': self.cancelled,
+                'tick': self.tick,
+                'slots': len(self.slots)
+            }
@@ -0,0 +1,181 @@
+import os
+import random
+import zlib
+
+import os_threads
+from text_masking import PLACEHOLDER_PATTERN
+from chat_logging import get_logger
+
+logger = get_logger(__name__)
+
+# 묶음 번역 시 문장을 이어 붙이는 구분자 - 구분자가 들어 있는 문장은 묶지 않는다
+BATCH_DELIMITER = '\n'
+
+class TranslationBackend:
+    """번역 백엔드 인터페이스 - translate / translate_batch / detect"""
+    name = 'base'
+
+    def translate(self, text, source_lang, target_lang):
+        """번역 결과 문자열 반환 - 실패 시 예외"""
+        raise NotImplementedError
+
+    def can_batch(self, text):
+        """translate_batch로 다른 문장과 함께 보낼 수 있는 문장인지"""
+        return True
+
+    def translate_batch(self, texts, source_lang, target_lang):
+        """
+        여러 문장 번역 - 같은 순서의 리스트 반환, 실패한 항목은 None
+        함께 보낼 수 있는 문장이 없어 요청을 보내지 않았으면 None 자체를 반환
+        """
+        results = []
+        for text in texts:
+            try:
+                results.append(self.translate(text, source_lang, target_lang))
+            except Exception:
+                results.append(None)
+        return results
+
+    def detect(self, text):
+        """언어 코드 반환 - 실패 시 예외"""
+        raise NotImplementedError
+
+
+class GoogletransBackend(TranslationBackend):
+    """googletrans 어댑터"""
+    name = 'googletrans'
+
+    def __init__(self):
+        from googletrans import Translator
+        self.translator = Translator()
+
+    def translate(self, text, source_lang, target_lang):
+        result = self.translator.translate(text, src=source_lang, dest=target_lang)
+        return result.text
+
+    def can_batch(self, text):
+        return BATCH_DELIMITER not in text
+
+    def translate_batch(self, texts, source_lang, target_lang):
+        """
+        구분자로 이어 붙여 한 번에 번역 후 다시 나눈다
+        googletrans의 리스트 API는 항목마다 요청을 따로 보내므로 사용하지 않음
+        """
+        results = [None] * len(texts)
+        packable = [i for i, text in enumerate(texts) if self.can_batch(text)]
+        if len(packable) < 2:
+            return None  # 요청하지 않음
+
+        # 호출 오류는 그대로 올려 보내서 차단기가 실패로 집계하게 한다
+        logger.debug("묶음 번역 시도", source=source_lang, target=target_lang, items=len(packable))
+        translated = self.translate(
+            BATCH_DELIMITER.join(texts[i] for i in packable),
+            source_lang,
+            target_lang
+        )
+        parts = translated.split(BATCH_DELIMITER)
+
+        # 줄 수가 맞지 않으면 어디서 나뉘었는지 알 수 없으므로 전부 개별 번역
+        if len(parts) != len(packable):
+            logger.warning("묶음 번역 분리 실패", requested=len(packable), received=len(parts))
+            return results
+
+        for i, part in zip(packable, parts):
+            results[i] = part.strip()
+        return results
+
+    def detect(self, text):
+        return self.translator.detect(text).lang
+
+
+class LocalTranslationBackend(TranslationBackend):
+    """
+    네트워크 없이 동작하는 결정적 대체 백엔드 - 부하 테스트/프로파일링/CI용
+    사전에 있으면 사전 값을, 없으면 목표 언어 문자로 만든 가짜 번역을 돌려준다
+    """
+    name = 'local'
+
+    # 가짜 번역에 쓸 언어별 문자 범위
+    SCRIPT_RANGES = {
+        'ko': (0xAC00, 0xD7A3),  # 한글 음절
+        'ja': (0x3041, 0x3093),  # 히라가나
+        'en': (ord('a'), ord('z'))
+    }
+
+    def __init__(self, latency=0.0, failure_rate=0.0, dictionary=None, seed=None):
+        self.latency = latency  # 호출당 지연(초)
+        self.failure_rate = failure_rate  # 호출 실패 확률 (0~1)
+        self.dictionary = dictionary or {}  # (text, target_lang): translated
+        self.random = random.Random(seed)
+
+        # 통계
+        self.calls = 0
+        self.failures = 0
+
+    def _simulate_call(self):
+        """지연과 실패 주입"""
+        self.calls += 1
+        if self.latency > 0:
+            os_threads.sleep(self.latency)  # 작업 풀 스레드에서 호출됨
+        if self.failure_rate > 0 and self.random.random() < self.failure_rate:
+            self.failures += 1
+            raise RuntimeError('local backend injected failure')
+
+    def _pseudo_translate(self, text, target_lang):
+        """단어마다 같은 길이의 목표 언어 문자열 생성 - 같은 입력이면 항상 같은 결과"""
+        words = []
+        for word in text.split():
+            # 실제 번역기처럼 가린 구간의 자리표시자는 그대로 두고 나머지 글자만 바꾼다
+            pieces = []
+            last = 0
+            for match in PLACEHOLDER_PATTERN.finditer(word):
+                pieces.append(self._pseudo_word(word[last:match.start()], target_lang))
+                pieces.append(match.group(0))
+                last = match.end()
+            pieces.append(self._pseudo_word(word[last:], target_lang))
+            words.append(''.join(pieces))
+        return ' '.join(words)
+
+    def _pseudo_word(self, word, target_lang):
+        start, end = self.SCRIPT_RANGES.get(target_lang, self.SCRIPT_RANGES['en'])
+        seed = zlib.crc32(f"{word}:{target_lang}".encode('utf-8'))
+        return ''.join(chr(start + (seed + i * 7919) % (end - start + 1)) for i in range(len(word)))
+
+    def _translate_one(self, text, target_lang):
+        translated = self.dictionary.get((text, target_lang))
+        if translated is None:
+            translated = self._pseudo_translate(text, target_lang)
+        return translated
+
+    def translate(self, text, source_lang, target_lang):
+        self._simulate_call()
+        return self._translate_one(text, target_lang)
+
+    def translate_batch(self, texts, source_lang, target_lang):
+        # 묶음도 한 번의 호출로 취급
+        self._simulate_call()
+        return [self._translate_one(text, target_lang) for text in texts]
+
+    def detect(self, text):
+        self._simulate_call()
+        korean_chars = sum(1 for c in text if 0xAC00 <= ord(c) <= 0xD7AF)
+        japanese_chars = sum(1 for c in text if 0x3040 <= ord(c) <= 0x30FF)
+        if korean_chars == 0 and japanese_chars == 0:
+            return 'en'
+        return 'ko' if korean_chars >= japanese_chars else 'ja'
+
+
+def create_backend(name=None):
+    """설정(TRANSLATION_BACKEND 환경 변수)에 맞는 번역 백엔드 생성"""
+    name = (name or os.environ.get('TRANSLATION_BACKEND', 'googletrans')).lower()
+
+    if name == 'local':
+        return LocalTranslationBackend(
+            latency=float(os.environ.get('LOCAL_TRANSLATION_LATENCY_MS', 0)) / 1000,
+            failure_rate=float(os.environ.get('LOCAL_TRANSLATION_FAILURE_RATE', 0)),
+            seed=os.environ.get('LOCAL_TRANSLATION_SEED')
+        )
+    if name == 'googletrans':
+        return GoogletransBackend()
+
+    raise ValueError(f"Unknown translation backend: {name}")
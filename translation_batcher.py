@@ -0,0 +1,102 @@
+import eventlet
+from eventlet.event import Event
+
+from chat_logging import get_logger
+
+logger = get_logger(__name__)
+
+class TranslationBatcher:
+    def __init__(self, flush_func, window=0.005, max_items=16, max_chars=1000):
+        self.flush_func = flush_func  # (source_lang, target_lang, texts, priority, is_cancelled) -> [translated or None]
+        self.window = window  # 묶음을 모으는 시간(초)
+        self.max_items = max_items  # 한 묶음의 최대 항목 수
+        self.max_chars = max_chars  # 한 묶음의 최대 글자 수 - 긴 글의 문장들은 여러 묶음으로 나뉘어 동시에 번역
+        self.pending = {}  # (source_lang, target_lang, priority): [(text, event, is_cancelled)]
+        self.pending_chars = {}  # 묶음별 글자 수
+        self.flush_timer = None
+
+        # 통계
+        self.batches = 0
+        self.items = 0
+        self.cancelled = 0
+
+    def submit(self, text, source_lang, target_lang, priority=0, is_cancelled=None):
+        """
+        번역 요청을 묶음에 추가하고 결과를 기다릴 수 있는 Event(퓨처) 반환
+        우선순위가 다른 요청은 섞지 않는다 - 긴 글이 짧은 메시지 묶음을 붙잡지 않도록
+        is_cancelled()가 참이 된 요청은 번역하지 않고 원본으로 끝낸다
+        """
+        event = Event()
+        key = (source_lang, target_lang, priority)
+        group = self.pending.setdefault(key, [])
+        group.append((text, event, is_cancelled))
+        chars = self.pending_chars.get(key, 0) + len(text)
+        self.pending_chars[key] = chars
+
+        if len(group) >= self.max_items or chars >= self.max_chars:
+            # 묶음이 가득 차면 기다리지 않고 바로 전송
+            self._flush_group(key)
+        elif self.flush_timer is None:
+            self.flush_timer = eventlet.spawn_after(self.window, self._flush_all)
+
+        return event
+
+    def _flush_all(self):
+        """모인 묶음 전체 전송"""
+        self.flush_timer = None
+        for key in list(self.pending.keys()):
+            self._flush_group(key)
+
+    def _flush_group(self, key):
+        """(src, dest, 우선순위) 묶음 하나를 꺼내 별도 그린스레드에서 전송"""
+        items = self.pending.pop(key, None)
+        self.pending_chars.pop(key, None)
+        if items:
+            eventlet.spawn(self._run_batch, key, items)
+
+    def _run_batch(self, key, items):
+        """묶음 번역 후 결과를 각 요청자에게 나눠 준다"""
+        source_lang, target_lang, priority = key
+
+        # 받을 사람이 없어진 요청은 빼고 원본으로 끝낸다
+        live = []
+        for text, event, is_cancelled in items:
+            if is_cancelled is not None and is_cancelled():
+                self.cancelled += 1
+                event.send(text)
+            else:
+                live.append((text, event, is_cancelled))
+        if not live:
+            return
+        items = live
+        texts = list(dict.fromkeys(text for text, _, _ in items))  # 같은 문장은 한 번만
+
+        # 대기 중에 모든 요청이 취소되면 스케줄러가 묶음 전체를 버린다
+        checks = [is_cancelled for _, _, is_cancelled in items]
+        all_cancelled = None
+        if all(checks):
+            all_cancelled = lambda: all(check() for check in checks)
+
+        self.batches += 1
+        self.items += len(items)
+
+        try:
+            results = self.flush_func(source_lang, target_lang, texts, priority, all_cancelled)
+        except Exception as e:
+            logger.warning("묶음 번역 오류", source=source_lang, target=target_lang, error=str(e))
+            results = [None] * len(texts)
+
+        translated_by_text = dict(zip(texts, results))
+        for text, event, _ in items:
+            translated = translated_by_text.get(text)
+            event.send(translated if translated is not None else text)
+
+    def get_stats(self):
+        """묶음 처리 통계 반환"""
+        return {
+            'batches': self.batches,
+            'items': self.items,
+            'cancelled': self.cancelled,
+            'pending': sum(len(group) for group in self.pending.values()),
+            'avg_batch_size': self.items / self.batches if self.batches else 0.0
+        }
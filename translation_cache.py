@@ -0,0 +1,121 @@
+import time
+import unicodedata
+from collections import OrderedDict
+from os_threads import Lock
+
+class TranslationCache:
+    def __init__(self, max_size=5000, ttl=3600, store=None):
+        self.max_size = max_size  # 최대 저장 개수
+        self.ttl = ttl  # 항목 유효 시간(초), 0 이하면 만료 없음
+        self.entries = OrderedDict()  # (text, src, dest): (translated, expires_at)
+        self.lock = Lock()  # 작업 풀 스레드에서도 호출됨
+        self.store = store  # 디스크 2단계 캐시 (TranslationStore, 선택)
+
+        # 통계
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.store_hits = 0
+
+    @staticmethod
+    def normalize(text):
+        """캐시 키용 텍스트 정규화 - 유니코드 정규화 + 공백 정리"""
+        return ' '.join(unicodedata.normalize('NFC', text).split())
+
+    def make_key(self, text, source_lang, target_lang):
+        """캐시 키 생성"""
+        return (self.normalize(text), source_lang, target_lang)
+
+    def get(self, text, source_lang, target_lang):
+        """메모리에 캐시된 번역 반환 - 없거나 만료되면 None (디스크는 보지 않으므로 허브에서 호출해도 된다)"""
+        key = self.make_key(text, source_lang, target_lang)
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                translated, expires_at = entry
+                if expires_at is None or expires_at > time.monotonic():
+                    # LRU 순서 갱신
+                    self.entries.move_to_end(key)
+                    self.hits += 1
+                else:
+                    # 만료된 항목은 제거
+                    del self.entries[key]
+                    self.evictions += 1
+                    entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+        if self.store is not None:
+            # 디스크 저장소의 정리/예열 순서가 메모리에서 쓰인 횟수도 반영하도록
+            self.store.record_hit(*key)
+        return translated
+
+    def get_stored(self, text, source_lang, target_lang):
+        """디스크 저장소의 번역 반환 - 찾으면 메모리에도 올린다 (디스크 I/O이므로 작업 풀 스레드에서만)"""
+        if self.store is None:
+            return None
+        key = self.make_key(text, source_lang, target_lang)
+        translated = self.store.get(*key)
+        if translated is not None:
+            self._put(key, translated)
+            with self.lock:
+                self.store_hits += 1
+        return translated
+
+    def set(self, text, source_lang, target_lang, translated):
+        """번역 결과 저장 - 검증을 통과한 결과만 넣어야 한다"""
+        if self.max_size <= 0:
+            return
+
+        key = self.make_key(text, source_lang, target_lang)
+        self._put(key, translated)
+        if self.store is not None:
+            self.store.set(*key, translated)
+
+    def _put(self, key, translated):
+        """메모리 캐시에만 저장"""
+        if self.max_size <= 0:
+            return
+        expires_at = time.monotonic() + self.ttl if self.ttl > 0 else None
+        with self.lock:
+            self.entries[key] = (translated, expires_at)
+            self.entries.move_to_end(key)
+
+            # 용량 초과 시 가장 오래 안 쓴 항목부터 제거
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+
+    def warm(self, limit=None):
+        """디스크 저장소에서 가장 많이 쓰인 번역을 메모리에 미리 올린다 - 올린 개수 반환"""
+        if self.store is None:
+            return 0
+        limit = self.max_size if limit is None else min(limit, self.max_size)
+        rows = self.store.hottest(limit)
+        # 덜 쓰인 것부터 넣어서 가장 많이 쓰인 항목이 LRU 끝(최근)에 오게 한다
+        for text, source_lang, target_lang, translated in reversed(rows):
+            self._put((text, source_lang, target_lang), translated)
+        return len(rows)
+
+    def clear(self):
+        """캐시 비우기"""
+        with self.lock:
+            self.entries.clear()
+
+    def get_stats(self):
+        """캐시 통계 반환"""
+        with self.lock:
+            total = self.hits + self.misses
+            stats = {
+                'size': len(self.entries),
+                'max_size': self.max_size,
+                'ttl': self.ttl,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'store_hits': self.store_hits,
+                'hit_rate': self.hits / total if total else 0.0
+            }
+        if self.store is not None:
+            stats['store'] = self.store.get_stats()
+        return stats
@@ -0,0 +1,148 @@
+import heapq
+import itertools
+import time
+import eventlet
+from eventlet import tpool
+from eventlet.event import Event
+
+import metrics
+from chat_logging import get_logger
+
+logger = get_logger(__name__)
+
+# 우선순위 등급 - 숫자가 작을수록 먼저 실행
+PRIORITY_INTERACTIVE = 0  # 짧은 대화 메시지
+PRIORITY_BULK = 1  # 긴 붙여넣기 등
+PRIORITY_NAMES = {PRIORITY_INTERACTIVE: 'interactive', PRIORITY_BULK: 'bulk'}
+
+EXPIRED = 'expired'
+CANCELLED = 'cancelled'
+
+class JobDropped(Exception):
+    """마감 시간이 지났거나 받을 사람이 없어 실행하지 않은 작업"""
+
+    def __init__(self, reason):
+        super().__init__(reason)
+        self.reason = reason
+
+class TranslationWorkerPool:
+    """
+    번역 작업 스케줄러 - 빈 워커가 생기면 (우선순위, 마감 시간) 순으로 꺼내 실행
+    실행 직전에 마감이 지났거나 취소 조건(is_cancelled)이 참이면 실행하지 않고 버린다
+    """
+
+    def __init__(self, max_workers=8, default_timeout=10):
+        self.max_workers = max_workers  # 동시에 실행할 최대 번역 작업 수
+        self.default_timeout = default_timeout  # 기본 대기 시간이자 작업 마감 시간(초)
+        self.heap = []  # (priority, deadline, seq, submitted, func, args, future, is_cancelled)
+        self.sequence = itertools.count()  # 같은 우선순위/마감이면 먼저 들어온 순
+
+        # 상태/통계 - 허브 위 그린스레드에서만 갱신되므로 락 불필요
+        self.queued = 0
+        self.active = 0
+        self.completed = 0
+        self.timeouts = 0
+        self.errors = 0
+        self.expired = 0
+        self.cancelled = 0
+        self.wait_totals = {name: [0, 0.0] for name in PRIORITY_NAMES.values()}  # 등급: [작업 수, 대기 합계]
+
+    def submit(self, func, *args, priority=PRIORITY_INTERACTIVE, deadline=None, is_cancelled=None):
+        """작업을 대기열에 넣고 결과를 기다릴 수 있는 Event(퓨처) 반환"""
+        submitted = time.monotonic()
+        if deadline is None:
+            deadline = submitted + self.default_timeout
+        future = Event()
+        heapq.heappush(self.heap, (priority, deadline, next(self.sequence), submitted,
+                                   func, args, future, is_cancelled))
+        self.queued += 1
+        self._dispatch()
+        return future
+
+    def _dispatch(self):
+        """빈 워커 수만큼 대기열에서 꺼내 실행 - 버릴 작업은 실행하지 않고 JobDropped 전달"""
+        while self.active < self.max_workers and self.heap:
+            priority, deadline, _, submitted, func, args, future, is_cancelled = heapq.heappop(self.heap)
+            self.queued -= 1
+            now = time.monotonic()
+            self._record_wait(priority, now - submitted)
+
+            reason = None
+            if now >= deadline:
+                reason = EXPIRED
+                self.expired += 1
+            elif is_cancelled is not None and is_cancelled():
+                reason = CANCELLED
+                self.cancelled += 1
+            if reason:
+                metrics.translation_jobs_dropped.inc(priority=PRIORITY_NAMES[priority], reason=reason)
+                future.send_exception(JobDropped(reason))
+                continue
+
+            self.active += 1
+            eventlet.spawn(self._run, func, args, future)
+
+    def _record_wait(self, priority, waited):
+        name = PRIORITY_NAMES[priority]
+        totals = self.wait_totals[name]
+        totals[0] += 1
+        totals[1] += waited
+        metrics.translation_queue_wait.observe(waited, priority=name)
+
+    def _run(self, func, args, future):
+        """실제 작업은 OS 스레드에서 실행 - 허브를 막지 않음"""
+        try:
+            result = tpool.execute(func, *args)
+        except Exception as e:
+            future.send_exception(e)
+        else:
+            future.send(result)
+        finally:
+            self.active -= 1
+            self.completed += 1
+            self._dispatch()
+
+    def wait(self, future, timeout=None, default=None):
+        """퓨처 결과 대기 - 시간 초과, 오류, 버려진 작업이면 default 반환"""
+        if timeout is None:
+            timeout = self.default_timeout
+
+        result = default
+        timed_out = True
+        try:
+            with eventlet.Timeout(timeout, False):
+                result = future.wait()
+                timed_out = False
+        except JobDropped:
+            return default
+        except Exception as e:
+            logger.warning("번역 작업 오류", error=str(e))
+            self.errors += 1
+            return default
+
+        if timed_out:
+            logger.warning("번역 작업 시간 초과", timeout=timeout)
+            self.timeouts += 1
+        return result
+
+    def get_stats(self):
+        """풀 상태 반환 - queue_depth는 실행을 기다리는 작업 수, wait_avg는 등급별 평균 대기(초)"""
+        waiting = {}
+        for item in self.heap:
+            name = PRIORITY_NAMES[item[0]]
+            waiting[name] = waiting.get(name, 0) + 1
+        return {
+            'max_workers': self.max_workers,
+            'queue_depth': self.queued,
+            'queued_by_priority': waiting,
+            'active': self.active,
+            'completed': self.completed,
+            'timeouts': self.timeouts,
+            'errors': self.errors,
+            'expired': self.expired,
+            'cancelled': self.cancelled,
+            'wait_avg': {
+                name: total / count if count else 0.0
+                for name, (count, total) in self.wait_totals.items()
+            }
+        }
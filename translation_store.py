@@ -0,0 +1,195 @@
+import hashlib
+import os
+import sqlite3
+import time
+
+import os_threads
+from chat_logging import get_logger
+
+logger = get_logger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS translations (
+    key TEXT PRIMARY KEY,
+    source_lang TEXT NOT NULL,
+    target_lang TEXT NOT NULL,
+    text TEXT NOT NULL,
+    translated TEXT NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 0,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS translations_hotness ON translations (hits, updated_at);
+"""
+
+class TranslationStore:
+    """
+    SQLite(WAL) 번역 저장소 - 재시작 후에도 남고 여러 워커 프로세스가 같은 파일을 동시에 읽는다
+    메모리 캐시(TranslationCache) 뒤의 2단계 캐시로 사용
+    """
+
+    def __init__(self, path, max_entries=100000, max_age=30 * 24 * 3600, evict_every=200, hit_flush_every=100):
+        self.path = path
+        self.max_entries = max_entries  # 저장 최대 개수 - 넘으면 덜 쓰인 것부터 삭제
+        self.max_age = max_age  # 이보다 오래된 번역은 사용하지 않음(초), 0 이하면 제한 없음
+        self.evict_every = evict_every  # 몇 번 쓸 때마다 용량 확인할지
+        self.hit_flush_every = hit_flush_every  # 사용 횟수를 몇 번 모아서 한 번에 기록할지
+        self.pending_hits = {}  # key: 아직 기록하지 않은 사용 횟수 - 읽기마다 쓰기 트랜잭션을 만들지 않는다
+        self.local = os_threads.local()  # sqlite 연결은 OS 스레드별로 하나씩
+        self.lock = os_threads.Lock()
+
+        # 통계
+        self.reads = 0
+        self.hits = 0
+        self.writes = 0
+        self.errors = 0
+        self.evictions = 0
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._connection().executescript(SCHEMA)
+
+    def _connection(self):
+        connection = getattr(self.local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            connection.execute('PRAGMA journal_mode=WAL')  # 쓰는 동안에도 다른 프로세스가 읽을 수 있음
+            connection.execute('PRAGMA synchronous=NORMAL')
+            self.local.connection = connection
+        return connection
+
+    @staticmethod
+    def make_key(text, source_lang, target_lang):
+        """(텍스트 해시, src, dest) 키 - 텍스트는 이미 정규화된 값"""
+        digest = hashlib.sha1(text.encode('utf-8')).hexdigest()
+        return f"{source_lang}:{target_lang}:{digest}"
+
+    def _cutoff(self):
+        return time.time() - self.max_age if self.max_age > 0 else 0
+
+    def get(self, text, source_lang, target_lang):
+        """
+        저장된 번역 반환 - 없으면 None (오류도 None, 캐시는 최선 노력)
+        읽기만 하고 사용 횟수는 메모리에 모았다가 flush_hits에서 한 번에 기록
+        """
+        key = self.make_key(text, source_lang, target_lang)
+        try:
+            row = self._connection().execute(
+                'SELECT text, translated FROM translations WHERE key = ? AND updated_at >= ?',
+                (key, self._cutoff())
+            ).fetchone()
+        except sqlite3.Error as e:
+            self.errors += 1
+            logger.warning("번역 저장소 읽기 오류", error=str(e))
+            return None
+
+        with self.lock:
+            self.reads += 1
+            if row is None or row[0] != text:
+                return None
+            self.hits += 1
+            self.pending_hits[key] = self.pending_hits.get(key, 0) + 1
+            flush = len(self.pending_hits) >= self.hit_flush_every
+        if flush:
+            self.flush_hits()
+        return row[1]
+
+    def record_hit(self, text, source_lang, target_lang):
+        """
+        메모리 캐시에서 쓰인 번역의 사용 횟수만 모아 둔다 - 디스크 I/O가 없어 허브에서 호출해도 된다
+        기록은 작업 풀 스레드의 get/set이 모인 횟수를 보고 flush_hits로 (종료 시에도 한 번)
+        """
+        key = self.make_key(text, source_lang, target_lang)
+        with self.lock:
+            self.pending_hits[key] = self.pending_hits.get(key, 0) + 1
+
+    def flush_hits(self):
+        """모아 둔 사용 횟수를 한 트랜잭션으로 기록"""
+        with self.lock:
+            pending, self.pending_hits = self.pending_hits, {}
+        if not pending:
+            return
+        try:
+            connection = self._connection()
+            with connection:
+                connection.execute('BEGIN')
+                connection.executemany(
+                    'UPDATE translations SET hits = hits + ? WHERE key = ?',
+                    [(count, key) for key, count in pending.items()]
+                )
+        except sqlite3.Error as e:
+            self.errors += 1
+            logger.warning("번역 저장소 사용 횟수 기록 오류", error=str(e))
+
+    def set(self, text, source_lang, target_lang, translated):
+        """번역 저장 - 이미 있으면 번역과 시각만 갱신 (누적 사용 횟수는 유지)"""
+        key = self.make_key(text, source_lang, target_lang)
+        try:
+            self._connection().execute(
+                'INSERT INTO translations (key, source_lang, target_lang, text, translated, updated_at) '
+                'VALUES (?, ?, ?, ?, ?, ?) '
+                'ON CONFLICT(key) DO UPDATE SET translated = excluded.translated, updated_at = excluded.updated_at',
+                (key, source_lang, target_lang, text, translated, time.time())
+            )
+        except sqlite3.Error as e:
+            self.errors += 1
+            logger.warning("번역 저장소 쓰기 오류", error=str(e))
+            return
+
+        with self.lock:
+            self.writes += 1
+            check = self.writes % self.evict_every == 0
+            flush = len(self.pending_hits) >= self.hit_flush_every
+        if check:
+            self.evict()
+        elif flush:
+            self.flush_hits()
+
+    def evict(self):
+        """용량 초과분을 덜 쓰이고 오래된 순서로 삭제"""
+        self.flush_hits()  # 삭제 순서가 최신 사용 횟수를 반영하도록
+        try:
+            connection = self._connection()
+            count = connection.execute('SELECT COUNT(*) FROM translations').fetchone()[0]
+            excess = count - self.max_entries
+            if excess > 0:
+                connection.execute(
+                    'DELETE FROM translations WHERE key IN '
+                    '(SELECT key FROM translations ORDER BY hits ASC, updated_at ASC LIMIT ?)',
+                    (excess,)
+                )
+                self.evictions += excess
+        except sqlite3.Error as e:
+            self.errors += 1
+            logger.warning("번역 저장소 정리 오류", error=str(e))
+
+    def hottest(self, limit):
+        """가장 많이 쓰인 번역 [(text, src, dest, translated)] - 시작 시 메모리 캐시 예열용"""
+        try:
+            return self._connection().execute(
+                'SELECT text, source_lang, target_lang, translated FROM translations '
+                'WHERE updated_at >= ? ORDER BY hits DESC, updated_at DESC LIMIT ?',
+                (self._cutoff(), limit)
+            ).fetchall()
+        except sqlite3.Error as e:
+            self.errors += 1
+            logger.warning("번역 저장소 예열 오류", error=str(e))
+            return []
+
+    def count(self):
+        try:
+            return self._connection().execute('SELECT COUNT(*) FROM translations').fetchone()[0]
+        except sqlite3.Error:
+            return 0
+
+    def get_stats(self):
+        """저장소 통계 반환"""
+        return {
+            'path': self.path,
+            'max_entries': self.max_entries,
+            'reads': self.reads,
+            'hits': self.hits,
+            'writes': self.writes,
+            'evictions': self.evictions,
+            'pending_hits': len(self.pending_hits),
+            'errors': self.errors
+        }
@@ -1,10 +1,86 @@
-from googletrans import Translator
+import atexit
+import os
 import time
 import random
+import eventlet
+import eventlet.queue
+from eventlet.event import Event
+
+from translation_cache import TranslationCache
+from translation_store import TranslationStore
+from translation_pool import TranslationWorkerPool, JobDropped, PRIORITY_INTERACTIVE, PRIORITY_BULK
+from translation_batcher import TranslationBatcher
+from translation_backends import create_backend
+from language_detector import LANGUAGE_SCRIPTS, has_mixed_languages
+import text_masking
+from sentence_segmenter import split_sentences, merge_pieces
+from rate_limiter import TokenBucket
+from circuit_breaker import CircuitBreaker
+import os_threads
+import metrics
+
+from chat_logging import get_logger
+
+logger = get_logger(__name__)
 
 class TranslatorManager:
-    def __init__(self):
-        self.translator = Translator()
+    def __init__(self, cache_size=None, cache_ttl=None, max_workers=None, timeout=None, backend=None):
+        # 번역 백엔드 - 기본은 googletrans, TRANSLATION_BACKEND=local이면 오프라인 대체 백엔드
+        self.backend = backend or create_backend()
+        logger.info("번역 백엔드", backend=self.backend.name)
+        
+        # 번역 캐시 - 환경 변수로 크기/유효 시간 조정
+        if cache_size is None:
+            cache_size = int(os.environ.get('TRANSLATION_CACHE_SIZE', 5000))
+        if cache_ttl is None:
+            cache_ttl = int(os.environ.get('TRANSLATION_CACHE_TTL', 3600))
+        
+        # 디스크 번역 저장소 (SQLite WAL) - 재시작 후에도 유지되고 워커 프로세스끼리 공유
+        store = None
+        store_path = os.environ.get('TRANSLATION_STORE_PATH')
+        if store_path:
+            store = TranslationStore(
+                store_path,
+                max_entries=int(os.environ.get('TRANSLATION_STORE_MAX_ENTRIES', 100000)),
+                max_age=int(os.environ.get('TRANSLATION_STORE_MAX_AGE', 30 * 24 * 3600))
+            )
+            atexit.register(store.flush_hits)  # 아직 기록하지 않은 사용 횟수
+        self.cache = TranslationCache(max_size=cache_size, ttl=cache_ttl, store=store)
+        if store is not None:
+            warmed = self.cache.warm(int(os.environ.get('TRANSLATION_STORE_WARM', 2000)))
+            logger.info("번역 저장소 예열", path=store_path, entries=warmed)
+        
+        # 번역 작업 풀 - googletrans 호출이 eventlet 허브를 막지 않도록 분리
+        if max_workers is None:
+            max_workers = int(os.environ.get('TRANSLATION_WORKERS', 8))
+        if timeout is None:
+            timeout = float(os.environ.get('TRANSLATION_TIMEOUT', 10))
+        self.pool = TranslationWorkerPool(max_workers=max_workers, default_timeout=timeout)
+        # 이 길이 이하의 메시지는 대화형으로 보고 긴 글보다 먼저 번역
+        self.interactive_max_chars = int(os.environ.get('TRANSLATION_INTERACTIVE_MAX_CHARS', 280))
+        # 이보다 긴 글은 문장 단위로 나눠 번역/캐시 - 조각 수는 최대 chunk_max_pieces개
+        self.chunk_min_chars = int(os.environ.get('TRANSLATION_CHUNK_MIN_CHARS', 280))
+        self.chunk_max_pieces = int(os.environ.get('TRANSLATION_CHUNK_MAX_PIECES', 32))
+        
+        # 백엔드 보호 - 요청 속도 제한 + 연속 실패 시 차단 (fail fast)
+        self.rate_limiter = TokenBucket(
+            rate=float(os.environ.get('TRANSLATION_RATE_LIMIT', 10)),
+            capacity=float(os.environ.get('TRANSLATION_RATE_BURST', 20))
+        )
+        self.rate_limit_wait = float(os.environ.get('TRANSLATION_RATE_WAIT', 1.0))
+        self.circuit_breaker = CircuitBreaker(
+            failure_threshold=int(os.environ.get('TRANSLATION_BREAKER_THRESHOLD', 5)),
+            recovery_timeout=float(os.environ.get('TRANSLATION_BREAKER_COOLDOWN', 30))
+        )
+        
+        # 동시에 들어온 번역 요청을 (src, dest)별로 잠깐 모아서 한 번에 전송
+        self.batcher = TranslationBatcher(
+            self._run_batch_on_pool,
+            window=float(os.environ.get('TRANSLATION_BATCH_WINDOW_MS', 5)) / 1000,
+            max_items=int(os.environ.get('TRANSLATION_BATCH_SIZE', 16)),
+            max_chars=int(os.environ.get('TRANSLATION_BATCH_MAX_CHARS', 1000))
+        )
+        
         self.language_codes = {
             'korean': 'ko',
             'english': 'en', 
@@ -20,57 +96,287 @@ class TranslatorManager:
     def detect_language(self, text):
         """텍스트 언어 감지"""
         try:
-            detected = self.translator.detect(text)
-            return detected.lang
+            return self.backend.detect(text)
         except Exception as e:
-            print(f"언어 감지 오류: {e}")
+            logger.warning("언어 감지 오류", error=str(e))
             return 'en'  # 기본값
     
-    def translate_text(self, text, source_lang, target_lang, retry_count=3):
+    def _split(self, text):
+        """긴 글은 문장 조각 목록으로, 짧은 글은 [text] 그대로"""
+        if len(text) <= self.chunk_min_chars:
+            return [text]
+        pieces = merge_pieces(split_sentences(text), self.chunk_max_pieces)
+        if len(pieces) > 1:
+            metrics.translation_chunks.observe(len(pieces))
+        return pieces
+    
+    def _chunk_parts(self, pieces, source_lang, target_lang):
         """
-        텍스트 번역 - 개선된 버전
-        source_lang: 발신자 언어 (명시적으로 지정)
-        target_lang: 목표 언어
+        조각별 캐시 확인 - [[앞 공백, 문장, 뒤 공백, 번역]] (캐시에 없으면 번역은 None)
+        문장 앞뒤 공백/줄바꿈은 번역하지 않고 그대로 붙인다
         """
-        # 같은 언어면 번역하지 않음
-        if source_lang == target_lang:
-            return text
-            
-        # 빈 텍스트 처리
-        if not text or text.strip() == '':
-            return text
-            
-        print(f"번역 시도: '{text}' ({source_lang} -> {target_lang})")
+        parts = []
+        for piece in pieces:
+            sentence = piece.strip()
+            lead = piece[:len(piece) - len(piece.lstrip())]
+            trail = piece[len(lead) + len(sentence):]
+            if text_masking.is_translatable(sentence):
+                translated = self.cache.get(sentence, source_lang, target_lang)
+            else:
+                translated = sentence
+            parts.append([lead, sentence, trail, translated])
+        return parts
+    
+    def _submit_chunks(self, pieces, source_lang, target_lang, priority, is_cancelled):
+        """
+        긴 글 묶음 제출 - 캐시에 없는 문장만 배처에 넣는다 (배처가 글자 수로 나눠 동시에 번역)
+        모두 캐시에 있으면 (번역, None), 아니면 (None, 순서대로 이은 결과를 주는 퓨처)
+        """
+        parts = self._chunk_parts(pieces, source_lang, target_lang)
+        waiting = False
+        for part in parts:
+            if part[3] is None:
+                part[3] = self.batcher.submit(part[1], source_lang, target_lang,
+                                              priority=priority, is_cancelled=is_cancelled)
+                waiting = True
+        if not waiting:
+            return ''.join(lead + translated + trail for lead, _, trail, translated in parts), None
+        
+        future = Event()
+        eventlet.spawn(self._join_chunks, parts, future)
+        return None, future
+    
+    def _join_chunks(self, parts, future):
+        """조각 번역이 모두 끝나면 원래 순서대로 이어 퓨처에 전달 - 실패한 조각은 배처가 원문으로 채운다"""
+        future.send(''.join(
+            lead + (translated.wait() if isinstance(translated, Event) else translated) + trail
+            for lead, _, trail, translated in parts
+        ))
+    
+    def _needs_translation(self, text):
+        """번역할 글자가 있는지 로컬에서 판단 - 없으면 백엔드를 부르지 않는다"""
+        if text_masking.is_translatable(text):
+            return True
+        metrics.translation_fast_path.inc()
+        return False
+    
+    def _translate_remote(self, text, source_lang, target_lang, retry_count=3):
+        """번역 백엔드 호출 + 검증 + 재시도 - 캐시 확인은 호출하는 쪽에서"""
+        logger.debug("번역 시도", source=source_lang, target=target_lang, length=len(text), sample_rate=0.1)
         
         for attempt in range(retry_count):
+            if attempt > 0:
+                metrics.translation_retries.inc(source=source_lang, target=target_lang)
+            
+            # 차단 중이거나 속도 제한에 걸리면 재시도 없이 바로 원본 반환
+            if not self._acquire_backend_call():
+                break
+            
             try:
                 # 소스 언어를 명시적으로 지정하여 혼용 번역 방지
-                result = self.translator.translate(
-                    text, 
-                    src=source_lang,  # 소스 언어 명시
-                    dest=target_lang
-                )
-                
-                translated = result.text
+                with metrics.translation_backend_latency.time(source=source_lang, target=target_lang):
+                    translated = self.backend.translate(
+                        text, 
+                        source_lang,  # 소스 언어 명시
+                        target_lang
+                    )
+                self.circuit_breaker.record_success()
                 
                 # 번역 결과 검증
                 if self._is_valid_translation(text, translated, source_lang, target_lang):
-                    print(f"번역 성공: '{translated}'")
+                    logger.debug("번역 성공", source=source_lang, target=target_lang, attempt=attempt + 1, sample_rate=0.1)
+                    # 검증을 통과한 결과만 캐시에 저장
+                    self.cache.set(text, source_lang, target_lang, translated)
                     return translated
                 else:
-                    print(f"번역 품질 문제 감지, 재시도 중... (시도 {attempt + 1}/{retry_count})")
+                    metrics.translation_validation_failures.inc(source=source_lang, target=target_lang)
+                    logger.info("번역 품질 문제 감지, 재시도", source=source_lang, target=target_lang,
+                                attempt=attempt + 1, retry_count=retry_count)
                     
             except Exception as e:
-                print(f"번역 오류 (시도 {attempt + 1}/{retry_count}): {e}")
+                self.circuit_breaker.record_failure()
+                logger.warning("번역 오류", source=source_lang, target=target_lang,
+                               attempt=attempt + 1, retry_count=retry_count, error=str(e))
                 if attempt < retry_count - 1:
                     # 재시도 전 잠시 대기 (API 제한 방지)
-                    time.sleep(0.5 + random.uniform(0, 0.5))
+                    os_threads.sleep(0.5 + random.uniform(0, 0.5))
                     continue
         
         # 모든 시도 실패 시 원본 텍스트 반환
-        print(f"번역 실패, 원본 텍스트 반환: '{text}'")
+        logger.warning("번역 실패, 원본 텍스트 반환", source=source_lang, target=target_lang, length=len(text))
         return text
     
+    def _acquire_backend_call(self):
+        """백엔드 호출 허가 - 차단기 확인 후 토큰 버킷에서 토큰을 받는다"""
+        if not self.circuit_breaker.allow_request():
+            return False
+        if not self.rate_limiter.acquire(timeout=self.rate_limit_wait):
+            logger.warning("번역 요청 속도 제한 초과")
+            self.circuit_breaker.cancel_request()
+            return False
+        return True
+    
+    def wait_translation(self, future, original_text, timeout=None):
+        """번역 퓨처 대기 - 시간 초과나 오류면 원본 텍스트 반환"""
+        return self.pool.wait(future, timeout=timeout, default=original_text)
+    
+    def priority_for(self, text):
+        """짧은 메시지는 대화형, 긴 글은 뒤로"""
+        return PRIORITY_INTERACTIVE if len(text) <= self.interactive_max_chars else PRIORITY_BULK
+    
+    def submit_many(self, text, source_lang, target_langs, is_cancelled=None):
+        """
+        바로 줄 수 있는 번역과 기다려야 하는 번역을 나눈다 - (results, futures)
+        캐시 적중/번역 불필요 언어는 results, 나머지는 묶음 번역 퓨처
+        is_cancelled(target_lang)가 참이 되면 (받을 사람이 없으면) 그 언어 번역은 실행하지 않는다
+        """
+        started = time.monotonic()
+        priority = self.priority_for(text)
+        results = {}
+        futures = {}
+        translatable = [lang for lang in target_langs if lang != source_lang]
+        if translatable and not self._needs_translation(text):
+            translatable = []
+        masked = text_masking.mask(text) if translatable else None
+        pieces = self._split(masked.text) if translatable else None
+        for target_lang in target_langs:
+            if target_lang not in translatable:
+                results[target_lang] = text
+                continue
+            
+            check = None
+            if is_cancelled is not None:
+                check = lambda target_lang=target_lang: is_cancelled(target_lang)
+            
+            if len(pieces) > 1:
+                # 긴 글은 문장별로 캐시 확인/번역 후 다시 잇는다
+                cached, future = self._submit_chunks(pieces, source_lang, target_lang, priority, check)
+            else:
+                cached = self.cache.get(masked.text, source_lang, target_lang)
+                future = None
+                if cached is None:
+                    future = self.batcher.submit(masked.text, source_lang, target_lang,
+                                                 priority=priority, is_cancelled=check)
+            
+            if future is None:
+                results[target_lang] = masked.restore(cached)
+                metrics.translation_latency.observe(time.monotonic() - started, source=source_lang, target=target_lang)
+            else:
+                futures[target_lang] = future
+        return results, futures
+    
+    def iter_completed(self, text, source_lang, futures, timeout=None):
+        """
+        번역이 끝나는 순서대로 (target_lang, translated) 반환
+        모든 언어가 같은 마감 시간을 공유하고, 시간 초과나 오류면 원본 텍스트
+        퓨처는 가린 텍스트의 번역이므로 submit_many와 같은 마스킹으로 복원 (마스킹은 결정적)
+        """
+        if not futures:
+            return
+        masked = text_masking.mask(text)
+        if timeout is None:
+            timeout = self.pool.default_timeout
+        started = time.monotonic()
+        deadline = started + timeout
+        
+        completed = eventlet.queue.LightQueue()
+        
+        def wait_one(target_lang, future):
+            remaining = max(deadline - time.monotonic(), 0)
+            translated = self.wait_translation(future, masked.text, timeout=remaining)
+            completed.put((target_lang, masked.restore(translated)))
+        
+        for target_lang, future in futures.items():
+            eventlet.spawn(wait_one, target_lang, future)
+        for _ in range(len(futures)):
+            target_lang, translated = completed.get()
+            metrics.translation_latency.observe(time.monotonic() - started, source=source_lang, target=target_lang)
+            yield target_lang, translated
+    
+    def _run_batch_on_pool(self, source_lang, target_lang, texts, priority=PRIORITY_INTERACTIVE, is_cancelled=None):
+        """
+        묶음 하나를 작업 풀에서 번역 - 배처의 전송 함수, 버려진 작업의 항목은 원본 그대로
+        한 요청에 묶을 수 없는 항목(줄바꿈이 든 긴 글 조각 등)은 각자 작업으로 나눠 동시에 번역한다
+        (한 작업 안에서 차례로 보내면 조각 수만큼 응답이 늦어진다)
+        """
+        packable = [i for i, text in enumerate(texts) if self.backend.can_batch(text)]
+        if len(packable) < 2:
+            packable = []
+        packed = set(packable)
+        groups = ([packable] if packable else []) + [[i] for i in range(len(texts)) if i not in packed]
+
+        futures = [
+            (group, self.pool.submit(self._translate_batch_remote, source_lang, target_lang,
+                                     [texts[i] for i in group], priority=priority, is_cancelled=is_cancelled))
+            for group in groups
+        ]
+        results = [None] * len(texts)
+        for group, future in futures:
+            try:
+                translated = future.wait()
+            except JobDropped:
+                continue
+            for i, result in zip(group, translated):
+                results[i] = result
+        return results
+    
+    def _translate_batch_remote(self, source_lang, target_lang, texts):
+        """묶음 번역 (작업 풀 스레드) - 디스크 저장소에 없는 항목만 백엔드로 보낸다"""
+        results = [self.cache.get_stored(text, source_lang, target_lang) for text in texts]
+        missing = [i for i, translated in enumerate(results) if translated is None]
+        if missing:
+            translated = self._translate_backend_batch(source_lang, target_lang, [texts[i] for i in missing])
+            for i, value in zip(missing, translated):
+                results[i] = value
+        return results
+    
+    def _translate_backend_batch(self, source_lang, target_lang, texts):
+        """백엔드 한 번 호출 후 검증에 실패한 항목만 개별 재시도"""
+        # 함께 보낼 수 있는 문장이 둘 미만이면 묶음 호출 없이 개별 번역 (토큰/차단기 시험 호출을 쓰지 않음)
+        if sum(1 for text in texts if self.backend.can_batch(text)) < 2:
+            return [self._translate_remote(text, source_lang, target_lang) for text in texts]
+        
+        batch_results = [None] * len(texts)
+        if self._acquire_backend_call():
+            try:
+                with metrics.translation_backend_latency.time(source=source_lang, target=target_lang):
+                    response = self.backend.translate_batch(texts, source_lang, target_lang)
+                if response is None:
+                    # 백엔드가 요청을 보내지 않았으므로 성공으로 기록하지 않는다
+                    self.circuit_breaker.cancel_request()
+                else:
+                    batch_results = response
+                    self.circuit_breaker.record_success()
+            except Exception as e:
+                self.circuit_breaker.record_failure()
+                logger.warning("묶음 번역 오류", source=source_lang, target=target_lang, error=str(e))
+        
+        results = []
+        for text, translated in zip(texts, batch_results):
+            if translated is not None and self._is_valid_translation(text, translated, source_lang, target_lang):
+                self.cache.set(text, source_lang, target_lang, translated)
+                results.append(translated)
+            else:
+                if translated is not None:
+                    metrics.translation_validation_failures.inc(source=source_lang, target=target_lang)
+                results.append(self._translate_remote(text, source_lang, target_lang))
+        return results
+    
+    def get_batch_stats(self):
+        """묶음 번역 통계 반환"""
+        return self.batcher.get_stats()
+    
+    def get_backend_stats(self):
+        """백엔드 보호 장치(속도 제한/차단기) 상태 반환"""
+        return {
+            'rate_limiter': self.rate_limiter.get_stats(),
+            'circuit_breaker': self.circuit_breaker.get_stats()
+        }
+    
+    def get_pool_stats(self):
+        """번역 작업 풀 상태 반환"""
+        return self.pool.get_stats()
+    
     def _is_valid_translation(self, original, translated, source_lang, target_lang):
         """번역 결과 검증 - 혼용 언어 탐지"""
         if not translated:
@@ -80,57 +386,19 @@ class TranslatorManager:
         if original.strip() == translated.strip() and source_lang != target_lang:
             return False
         
-        # 혼용 언어 탐지를 위한 간단한 검증
-        try:
-            detected_lang = self.detect_language(translated)
-            
-            # 번역된 텍스트의 언어가 목표 언어와 유사하거나 관련이 있는지 확인
-            if target_lang == 'ko':
-                # 한국어로 번역했는데 영어나 일본어가 많이 섞여있으면 문제
-                if self._has_mixed_languages(translated, ['en', 'ja']):
-                    return False
-            elif target_lang == 'en':
-                # 영어로 번역했는데 한국어나 일본어가 많이 섞여있으면 문제  
-                if self._has_mixed_languages(translated, ['ko', 'ja']):
-                    return False
-            elif target_lang == 'ja':
-                # 일본어로 번역했는데 한국어나 영어가 많이 섞여있으면 문제
-                if self._has_mixed_languages(translated, ['ko', 'en']):
-                    return False
-                    
-        except Exception:
-            # 언어 검증 실패 시에도 번역 결과는 사용
-            pass
+        # 가린 구간의 자리표시자가 사라지거나 늘어나면 복원할 수 없음
+        if not text_masking.placeholders_intact(original, translated):
+            return False
+        
+        # 혼용 언어 탐지 - 네트워크 호출 없이 문자 종류 분포로 한 번에 판단
+        if target_lang in LANGUAGE_SCRIPTS and has_mixed_languages(translated, target_lang):
+            return False
             
         return True
     
-    def _has_mixed_languages(self, text, unwanted_langs):
-        """텍스트에 원치 않는 언어가 혼용되어 있는지 검사"""
-        try:
-            # 간단한 문자 기반 검증
-            korean_chars = sum(1 for c in text if ord(c) >= 0xAC00 and ord(c) <= 0xD7AF)
-            japanese_chars = sum(1 for c in text if (ord(c) >= 0x3040 and ord(c) <= 0x309F) or 
-                                (ord(c) >= 0x30A0 and ord(c) <= 0x30FF))
-            english_chars = sum(1 for c in text if c.isalpha() and ord(c) < 128)
-            
-            total_chars = len([c for c in text if c.isalpha() or (ord(c) >= 0x3040)])
-            
-            if total_chars == 0:
-                return False
-            
-            # 원치 않는 언어의 비율이 30% 이상이면 혼용으로 판단
-            for lang in unwanted_langs:
-                if lang == 'ko' and korean_chars / max(total_chars, 1) > 0.3:
-                    return True
-                elif lang == 'ja' and japanese_chars / max(total_chars, 1) > 0.3:
-                    return True  
-                elif lang == 'en' and english_chars / max(total_chars, 1) > 0.3:
-                    return True
-                    
-        except Exception:
-            pass
-            
-        return False
+    def get_cache_stats(self):
+        """번역 캐시 통계 반환"""
+        return self.cache.get_stats()
     
     def get_language_name(self, code):
         """언어 코드를 언어 이름으로 변환"""
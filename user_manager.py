@@ -1,106 +1,237 @@
 import uuid
 from threading import Lock
 
+from state_store import InMemoryStateStore
+from chat_logging import get_logger
+
+logger = get_logger(__name__)
+
+# 저장소 키
+USERS_KEY = 'users'  # 해시 - session_id: UserRecord
+
+def room_languages_key(room_id):
+    """방에 있는 언어 코드 집합 키"""
+    return f"room_languages:{room_id}"
+
+def room_language_users_key(room_id, language):
+    """방 안에서 해당 언어를 쓰는 session_id 집합 키"""
+    return f"room_language_users:{room_id}:{language}"
+
+def presence_version_key(room_id):
+    """방 참가자 목록 버전 카운터 키"""
+    return f"presence_version:{room_id}"
+
+# 계정별 member_id 생성용 네임스페이스 - google_id를 그대로 내보내지 않는다
+MEMBER_NAMESPACE = uuid.UUID('12229791-2864-4bae-8e7f-2d15143abc87')
+
+
+class UserRecord:
+    """접속 사용자 정보 - 필요한 필드만 __slots__로 보관 (google_info 전체는 저장하지 않음)"""
+    __slots__ = ('user_id', 'google_id', 'nickname', 'picture', 'language', 'current_room')
+
+    def __init__(self, user_id, google_id, nickname, picture='', language=None, current_room=None):
+        self.user_id = user_id
+        self.google_id = google_id
+        self.nickname = nickname
+        self.picture = picture
+        self.language = language  # 초기에는 None, 방 입장 시 설정
+        self.current_room = current_room
+
+    def to_dict(self):
+        return {field: getattr(self, field) for field in self.__slots__}
+
+    @property
+    def member_id(self):
+        """참가자 목록의 계정 식별자 - 같은 계정이면 접속(탭)이 여러 개여도 같은 값"""
+        return str(uuid.uuid5(MEMBER_NAMESPACE, str(self.google_id)))
+
+    def to_member(self):
+        """참가자 목록에 보낼 공개 정보 - session_id 대신 계정별 member_id 사용"""
+        return {
+            'member_id': self.member_id,
+            'nickname': self.nickname,
+            'language': self.language or 'en',  # 기본값 설정
+            'picture': self.picture
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(**{field: data.get(field) for field in cls.__slots__})
+
+    @classmethod
+    def load(cls, value):
+        """저장소 값 -> UserRecord (Redis 저장소는 dict로 돌려준다)"""
+        if value is None or isinstance(value, cls):
+            return value
+        return cls.from_dict(value)
+
+
 class UserManager:
-    def __init__(self):
-        self.users = {}  # session_id: user_info
+    def __init__(self, store=None):
+        self.store = store or InMemoryStateStore()  # 사용자 저장소 (프로세스 간 공유 가능)
         self.lock = Lock()  # 동시성 제어
     
     def add_user(self, session_id, google_info):
         """새 사용자 추가 - 언어 정보는 나중에 설정"""
         with self.lock:
-            user_id = str(uuid.uuid4())
-            self.users[session_id] = {
-                'user_id': user_id,
-                'google_info': google_info,
-                'nickname': google_info['name'],
-                'language': None,  # 초기에는 None, 방 입장 시 설정
-                'current_room': None
-            }
-            print(f'사용자 연결됨: {google_info["name"]} ({session_id})')
-            return self.users[session_id]
+            user = UserRecord(
+                user_id=str(uuid.uuid4()),
+                google_id=google_info['id'],
+                nickname=google_info['name'],
+                picture=google_info.get('picture', '')
+            )
+            self.store.hset(USERS_KEY, session_id, user)
+            logger.debug("사용자 연결됨", session_id=session_id, nickname=user.nickname)
+            return user
     
     def remove_user(self, session_id):
         """사용자 제거 - 유령 방지를 위한 안전한 제거"""
         with self.lock:
-            user = self.users.pop(session_id, None)
+            user = UserRecord.load(self.store.hdel(USERS_KEY, session_id))
             if user:
-                print(f'사용자 연결 해제됨: {user["nickname"]} ({session_id})')
+                self._unindex(session_id, user.current_room, user.language)
+                logger.debug("사용자 연결 해제됨", session_id=session_id, nickname=user.nickname)
                 return user
             else:
-                print(f'존재하지 않는 사용자 제거 시도: {session_id}')
+                logger.warning("존재하지 않는 사용자 제거 시도", session_id=session_id)
                 return None
     
     def get_user(self, session_id):
         """사용자 정보 반환"""
-        return self.users.get(session_id)
+        return UserRecord.load(self.store.hget(USERS_KEY, session_id))
     
     def set_user_language(self, session_id, language_code):
-        """사용자 언어 설정"""
+        """사용자 언어 설정 - 방에 있으면 언어 색인도 옮긴다"""
         with self.lock:
-            if session_id in self.users:
-                self.users[session_id]['language'] = language_code
-                print(f"사용자 언어 설정: {session_id} -> {language_code}")
+            user = UserRecord.load(self.store.hget(USERS_KEY, session_id))
+            if user:
+                if user.language != language_code:
+                    self._unindex(session_id, user.current_room, user.language)
+                    self._index(session_id, user.current_room, language_code)
+                user.language = language_code
+                self.store.hset(USERS_KEY, session_id, user)
+                logger.debug("사용자 언어 설정", session_id=session_id, language=language_code)
                 return True
             return False
     
     def set_user_room(self, session_id, room_id):
-        """사용자의 현재 방 설정"""
+        """사용자의 현재 방 설정 - 언어 색인도 함께 갱신"""
         with self.lock:
-            if session_id in self.users:
-                self.users[session_id]['current_room'] = room_id
+            user = UserRecord.load(self.store.hget(USERS_KEY, session_id))
+            if user:
+                if user.current_room != room_id:
+                    self._unindex(session_id, user.current_room, user.language)
+                    self._index(session_id, room_id, user.language)
+                user.current_room = room_id
+                self.store.hset(USERS_KEY, session_id, user)
                 return True
             return False
-    
-    def get_room_user_list(self, room_user_ids):
-        """방의 사용자 목록을 정리된 형태로 반환 - 중복 및 유령 제거"""
-        user_list = []
-        seen_users = set()  # 중복 방지
-        
+
+    def _index(self, session_id, room_id, language):
+        """방 -> 언어 -> session_id 색인에 추가 (lock 보유 상태에서 호출)"""
+        if not room_id or not language:
+            return
+        self.store.sadd(room_languages_key(room_id), language)
+        self.store.sadd(room_language_users_key(room_id, language), session_id)
+
+    def _unindex(self, session_id, room_id, language):
+        """
+        색인에서 제거 (lock 보유 상태에서 호출)
+        언어 그룹이 비어도 언어 목록에서는 빼지 않는다 - scard 확인과 srem 사이에 다른 프로세스가
+        같은 언어로 들어오면 그 사용자가 색인에서 빠지므로, 빈 그룹은 읽을 때 건너뛰고 방 삭제 때 정리
+        """
+        if not room_id or not language:
+            return
+        self.store.srem(room_language_users_key(room_id, language), session_id)
+
+    def get_language_groups(self, room_id):
+        """방 사용자를 언어별로 묶은 색인 반환 - {language: {session_ids}}, 사용자별 조회 없음, 빈 언어는 제외"""
+        language_groups = {}
+        for language in self.store.smembers(room_languages_key(room_id)):
+            session_ids = self.store.smembers(room_language_users_key(room_id, language))
+            if session_ids:
+                language_groups[language] = session_ids
+        return language_groups
+
+    def get_language_users(self, room_id, language):
+        """방에서 해당 언어를 쓰는 session_id 스냅샷"""
+        return self.store.smembers(room_language_users_key(room_id, language))
+
+    def _get_room_users(self, room_id):
+        """방 안의 (session_id, UserRecord) 목록 - 언어 색인의 session_id로 한 번에 조회 (유령은 제외)"""
+        session_ids = [sid for sids in self.get_language_groups(room_id).values() for sid in sids]
+        room_users = []
         with self.lock:
-            for session_id in room_user_ids:
-                if session_id in self.users:
-                    user = self.users[session_id]
-                    user_key = (user['nickname'], user['google_info']['id'])
-                    
-                    # 중복 사용자 체크
-                    if user_key not in seen_users:
-                        seen_users.add(user_key)
-                        user_list.append({
-                            'nickname': user['nickname'],
-                            'language': user['language'] or 'en',  # 기본값 설정
-                            'picture': user['google_info'].get('picture', ''),
-                            'session_id': session_id  # 디버깅용
-                        })
+            users = self.store.hmget(USERS_KEY, session_ids)
+            for session_id, user in zip(session_ids, users):
+                user = UserRecord.load(user)
+                if user:
+                    room_users.append((session_id, user))
                 else:
-                    # 유령 사용자 감지
-                    print(f"유령 사용자 감지: {session_id}")
-        
-        print(f"정리된 사용자 목록: {len(user_list)}명")
-        return user_list
+                    logger.warning("유령 사용자 감지", session_id=session_id)
+        return room_users
+
+    def get_room_members(self, room_id):
+        """방 참가자 목록 - 같은 계정의 여러 접속은 한 명으로"""
+        members = []
+        seen_accounts = set()  # 중복 방지
+        for _, user in self._get_room_users(room_id):
+            if user.google_id not in seen_accounts:
+                seen_accounts.add(user.google_id)
+                members.append(user.to_member())
+        return members
+
+    def find_account_session(self, room_id, google_id, exclude_sid=None):
+        """방 안에 남아 있는 같은 계정의 다른 접속 UserRecord - 없으면 None"""
+        for session_id, user in self._get_room_users(room_id):
+            if session_id != exclude_sid and user.google_id == google_id:
+                return user
+        return None
+
+    def bump_presence_version(self, room_id):
+        """방 참가자 목록이 바뀔 때마다 1씩 증가하는 버전 - 클라이언트가 누락을 감지"""
+        return self.store.incr(presence_version_key(room_id))
+
+    def get_presence_snapshot(self, room_id):
+        """방 참가자 전체 스냅샷 - 버전을 먼저 읽으므로 이후 델타를 다시 적용해도 결과가 같다"""
+        version = self.store.get_counter(presence_version_key(room_id))
+        return {
+            'room_id': room_id,
+            'version': version,
+            'members': self.get_room_members(room_id)
+        }
+
+    def clear_room_presence(self, room_id):
+        """삭제된 방의 참가자 버전과 언어 목록 정리 - 빈 언어 그룹 집합은 저장소에서 이미 사라짐"""
+        self.store.delete(presence_version_key(room_id), room_languages_key(room_id))
+    
+    def count_users(self):
+        """접속 중인 사용자 수"""
+        return self.store.hlen(USERS_KEY)
     
     def is_user_exists(self, session_id):
         """사용자 존재 여부 확인"""
-        return session_id in self.users
+        return self.store.hexists(USERS_KEY, session_id)
     
     def get_user_nickname_safe(self, session_id):
         """안전한 사용자 닉네임 반환 - 유령 방지"""
-        user = self.users.get(session_id)
-        if user and user.get('nickname'):
-            return user['nickname']
+        user = self.get_user(session_id)
+        if user and user.nickname:
+            return user.nickname
         return None  # None 반환으로 유령 메시지 방지
     
     def clean_ghost_users(self, active_sessions):
         """유령 사용자 정리 - 주기적으로 호출"""
         with self.lock:
             ghost_sessions = []
-            for session_id in list(self.users.keys()):
+            for session_id in self.store.hgetall(USERS_KEY).keys():
                 if session_id not in active_sessions:
                     ghost_sessions.append(session_id)
             
             for ghost_id in ghost_sessions:
-                user = self.users.pop(ghost_id, None)
+                user = UserRecord.load(self.store.hdel(USERS_KEY, ghost_id))
                 if user:
-                    print(f"유령 사용자 정리: {user['nickname']} ({ghost_id})")
+                    self._unindex(ghost_id, user.current_room, user.language)
+                    logger.info("유령 사용자 정리", session_id=ghost_id, nickname=user.nickname)
             
             return len(ghost_sessions)
\ No newline at end of file